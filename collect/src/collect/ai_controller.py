@@ -9,10 +9,27 @@ from typing import Optional
 from .neural_agent import NeuralPolicyAgent
 from .types import Action, Observation
 
-try:
-    from .puffer_agent import CollectPufferAgent
-except ImportError:  # pragma: no cover - optional dependency
-    CollectPufferAgent = None  # type: ignore[misc]
+# Resolved on first use so that importing the controller does not pull in torch.
+_NOT_LOADED = object()
+CollectPufferAgent: object = _NOT_LOADED
+
+
+_ACTION_COUNT = len(Action)
+
+
+def _puffer_agent_class() -> Optional[type]:
+    global CollectPufferAgent
+    if CollectPufferAgent is _NOT_LOADED:
+        try:
+            from .puffer_agent import CollectPufferAgent as agent_class
+        except ImportError:  # pragma: no cover - optional dependency
+            agent_class = None
+        CollectPufferAgent = agent_class
+    return CollectPufferAgent  # type: ignore[return-value]
+
+
+def _puffer_requested(flag: str) -> bool:
+    return flag.strip().lower() in {"1", "true", "yes"}
 
 
 @dataclass
@@ -34,24 +51,28 @@ class AIController:
 
     @classmethod
     def default_agent(cls) -> object:
-        prefer_puffer = os.getenv("COLLECT_USE_PUFFER", "").strip().lower() in {"1", "true", "yes"}
-        if prefer_puffer:
+        if _puffer_requested(os.getenv("COLLECT_USE_PUFFER", "")):
             agent = cls._build_puffer_agent()
             if agent is not None:
                 print("AIController: using PufferLib agent")
                 return agent
             print("AIController: falling back to built-in neural agent")
-        return NeuralPolicyAgent(state_size=cls._encoded_state_length, action_size=len(Action))
+        return NeuralPolicyAgent(state_size=cls._encoded_state_length, action_size=_ACTION_COUNT)
 
     @classmethod
     def _build_puffer_agent(cls) -> Optional[object]:
-        if CollectPufferAgent is None:
+        agent_class = _puffer_agent_class()
+        if agent_class is None:
             return None
         try:
-            agent = CollectPufferAgent(state_size=cls._encoded_state_length, action_size=len(Action))
+            agent = agent_class(
+                state_size=cls._encoded_state_length,
+                action_size=_ACTION_COUNT,
+                compile_encoder=_puffer_requested(os.getenv("COLLECT_TORCH_COMPILE", "")),
+            )
         except TypeError:
             try:
-                agent = CollectPufferAgent()  # type: ignore[call-arg]
+                agent = agent_class()  # type: ignore[call-arg]
             except Exception:
                 return None
         except Exception:  # pragma: no cover - defensive
@@ -65,7 +86,7 @@ class AIController:
         agent = self._agent
         if agent is None:
             return None
-        state_vector = observation.as_vector()
+        state_vector = observation.vector
         try:
             raw_action = agent.act(state_vector, self.player_identifier)  # type: ignore[attr-defined]
         except TypeError:
@@ -96,7 +117,7 @@ class AIController:
         agent = self._agent
         if agent is None:
             return
-        next_state = next_observation.as_vector()
+        next_state = next_observation.vector
         if hasattr(agent, "learn"):
             try:
                 agent.learn(reward, next_state, is_terminal, self.player_identifier)  # type: ignore[attr-defined]
@@ -45,7 +45,7 @@ class Game:
     _ROLLING_SCORE_WINDOW_SECONDS = 5 * 60.0
     _ROLLING_REWARD_WINDOW_SECONDS = 5 * 60.0
 
-    def __init__(self, player_count: int = DEFAULT_PLAYER_COUNT) -> None:
+    def __init__(self, player_count: int = DEFAULT_PLAYER_COUNT, rng: random.Random | None = None) -> None:
         if pygame is None:
             raise RuntimeError("pygame is required to run the Collect game loop; install pygame to continue")
         pygame.init()
@@ -59,6 +59,7 @@ class Game:
         self._human_controller = HumanController()
         self._human_player_identifier: int | None = None
         self._escape_stage = 0
+        self._rng = rng or random.Random()
         players = self._build_players(player_count)
         self._state = GameState(players)
         self._ai_controllers: Dict[int, AIController] = {
@@ -309,6 +310,7 @@ class Game:
         players = getattr(self._state, "players", ())
         if not players:
             return
+        rng = self._rng
         candidates: List[Tuple[float, AIController]] = []
         for player in players:
             if self._human_player_identifier == player.identifier:
@@ -321,7 +323,7 @@ class Game:
                 if hasattr(self, "_rolling_score")
                 else 0.0
             )
-            score_with_jitter = rolling_total + random.random()
+            score_with_jitter = rolling_total + rng.random()
             candidates.append((score_with_jitter, controller))
         if not candidates:
             return
@@ -335,7 +337,7 @@ class Game:
         remaining_controllers = [entry[1] for entry in candidates[1:]]
         if not remaining_controllers:
             return
-        selected = random.choice(remaining_controllers)
+        selected = rng.choice(remaining_controllers)
         if hasattr(selected, "randomize_agent_percentile"):
             selected.randomize_agent_percentile(20.0)
         elif hasattr(selected, "randomize_agent"):
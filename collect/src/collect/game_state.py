@@ -101,6 +101,14 @@ class GameState:
             raise ValueError("GameState requires at least one player")
         self._objects = self._initialise_objects(players_list)
 
+    @classmethod
+    def from_objects(cls, objects: GameObjects) -> "GameState":
+        if not objects.players:
+            raise ValueError("GameState requires at least one player")
+        state = cls.__new__(cls)
+        state._objects = objects
+        return state
+
     @property
     def players(self) -> Tuple[Player, ...]:
         return self._objects.players
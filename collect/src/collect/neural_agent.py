@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import math
-import random
 from dataclasses import dataclass, field
 from typing import Dict, Sequence, Tuple
 
 import numpy as np
 
 
-def _softmax(logits: np.ndarray) -> np.ndarray:
-    shifted = logits - np.max(logits)
-    exp = np.exp(shifted)
-    return exp / np.sum(exp)
+def _softmax_inplace(logits: np.ndarray) -> np.ndarray:
+    """Overwrite ``logits`` with its softmax and return it."""
+    logits -= logits.max()
+    np.exp(logits, out=logits)
+    logits *= 1.0 / logits.sum()
+    return logits
 
 
 @dataclass
@@ -29,45 +30,103 @@ class NeuralPolicyAgent:
     epsilon_decay: float = 0.99995
     epsilon_min: float = 0.05
     baseline_momentum: float = 0.99
+    max_actors: int = 64
 
-    _weights: Tuple[np.ndarray, ...] = field(init=False)
-    _biases: Tuple[np.ndarray, ...] = field(init=False)
+    _parameters: np.ndarray = field(init=False, repr=False)
+    _weight_views: Tuple[np.ndarray, ...] = field(init=False, repr=False)
+    _bias_views: Tuple[np.ndarray, ...] = field(init=False, repr=False)
     _baseline: float = field(default=0.0, init=False)
     _traces: Dict[int, Tuple[Tuple[np.ndarray, ...], np.ndarray, int]] = field(default_factory=dict, init=False)
-    _epsilon_values: Dict[int, float] = field(default_factory=dict, init=False)
+    _epsilon_values: np.ndarray = field(init=False)
+    _derivative_buffers: Tuple[np.ndarray, ...] = field(init=False)
+    _activation_arenas: Dict[int, np.ndarray] = field(default_factory=dict, init=False)
+    _outer_buffers: Tuple[np.ndarray, ...] = field(init=False)
+    _rng: np.random.Generator = field(default_factory=np.random.default_rng, init=False)
+    _cumulative: np.ndarray = field(init=False)
 
     def __post_init__(self) -> None:
         if self.hidden_layers < 1:
             msg = f"hidden_layers must be >= 1 (got {self.hidden_layers})"
             raise ValueError(msg)
 
-        rng = np.random.default_rng()
-        self._weights, self._biases = self._initialize_parameters(rng)
+        self._allocate_parameters()
+        self._fill_parameters(self._rng)
+        self._epsilon_values = np.full(max(1, self.max_actors), self.epsilon_start, dtype=np.float32)
+        self._derivative_buffers = tuple(
+            np.empty(self.hidden_size, dtype=np.float32) for _ in range(self.hidden_layers)
+        )
+        self._outer_buffers = tuple(np.empty_like(weight) for weight in self._weights)
+        self._cumulative = np.empty(self.action_size, dtype=np.float32)
+
+    @property
+    def _weights(self) -> Tuple[np.ndarray, ...]:
+        """Per-layer weight views into ``_parameters``; write through them, never rebind them."""
+        return self._weight_views
+
+    @property
+    def _biases(self) -> Tuple[np.ndarray, ...]:
+        """Per-layer bias views into ``_parameters``; write through them, never rebind them."""
+        return self._bias_views
+
+    def __getstate__(self) -> dict:
+        # Copying or pickling the views would detach them from the copied buffer; rebuild them instead.
+        state = self.__dict__.copy()
+        del state["_weight_views"], state["_bias_views"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._bind_parameter_views()
 
     def act(self, state: Sequence[float], actor_id: int = 0) -> int:
+        # Validates actor_id before any per-actor state is touched.
+        epsilon = self._epsilon_for(actor_id)
         state_vector = np.asarray(state, dtype=np.float32)
 
         activations = [state_vector]
 
+        arena = self._activation_arena(actor_id)
         current = state_vector
         for layer_index in range(self.hidden_layers):
-            current = np.tanh(current @ self._weights[layer_index] + self._biases[layer_index])
+            current = np.matmul(current, self._weights[layer_index], out=arena[layer_index])
+            current += self._biases[layer_index]
+            np.tanh(current, out=current)
             activations.append(current)
 
-        logits = current @ self._weights[-1] + self._biases[-1]
-        probs = _softmax(logits)
+        logits = current @ self._weights[-1]
+        logits += self._biases[-1]
+        # The logits array is freshly allocated by the matmul, so it can hold the probabilities.
+        probs = _softmax_inplace(logits)
 
-        epsilon = self._epsilon_for(actor_id)
-        if random.random() < epsilon:
-            action = random.randrange(self.action_size)
+        rng = self._rng
+        if epsilon > 0.0 and rng.random() < epsilon:
+            action = int(rng.integers(self.action_size))
         else:
-            action = int(np.random.choice(self.action_size, p=probs))
+            action = self._sample(probs)
 
         self._traces[actor_id] = (tuple(activations), probs, action)
 
         self._decay_epsilon(actor_id)
         return action
 
+    def _activation_arena(self, actor_id: int) -> np.ndarray:
+        """Return the reusable hidden-activation rows for ``actor_id``.
+
+        Each actor gets its own arena because its activations stay referenced by
+        the pending trace until ``learn`` consumes them.
+        """
+        arena = self._activation_arenas.get(actor_id)
+        if arena is None:
+            arena = np.empty((self.hidden_layers, self.hidden_size), dtype=np.float32)
+            self._activation_arenas[actor_id] = arena
+        return arena
+
+    def _sample(self, probs: np.ndarray) -> int:
+        """Draw an action index from ``probs`` by inverse-CDF lookup on a reused buffer."""
+        cumulative = np.cumsum(probs, out=self._cumulative)
+        index = int(np.searchsorted(cumulative, self._rng.random() * cumulative[-1], side="right"))
+        return min(index, self.action_size - 1)
+
     def learn(self, reward: float, next_state: Sequence[float], done: bool, actor_id: int = 0) -> None:  # noqa: ARG002
         trace = self._traces.pop(actor_id, None)
         if trace is None:
@@ -75,53 +134,63 @@ class NeuralPolicyAgent:
 
         activations, probs, action = trace
 
-        advantage = reward - self._baseline
-        self._baseline = self.baseline_momentum * self._baseline + (1 - self.baseline_momentum) * reward
+        baseline = self._baseline
+        advantage = reward - baseline
+        self._baseline = baseline + (1.0 - self.baseline_momentum) * advantage
 
-        one_hot = np.zeros_like(probs)
-        one_hot[action] = 1.0
+        delta2 = probs * -advantage
+        delta2[action] += advantage
 
-        delta2 = (one_hot - probs) * advantage
+        learning_rate = self.learning_rate
+        weight_updates = self._outer_buffers
         final_activation = activations[-1]
         if np.allclose(final_activation, 0.0):
             final_activation = np.ones_like(final_activation)
-        weight_updates = [np.zeros_like(layer) for layer in self._weights]
-        bias_updates = [np.zeros_like(layer) for layer in self._biases]
-        weight_updates[-1] = self.learning_rate * np.outer(final_activation, delta2)
-        bias_updates[-1] = self.learning_rate * delta2
+        np.multiply(final_activation[:, np.newaxis], delta2, out=weight_updates[-1])
+        # Biases are never read during backprop, so they can be updated straight away.
+        output_bias = self._biases[-1]
+        output_bias += learning_rate * delta2
 
         delta = delta2
         for layer_index in range(self.hidden_layers - 1, -1, -1):
-            hidden_output = activations[layer_index + 1]
-            derivative = 1.0 - hidden_output**2
-            delta = (delta @ self._weights[layer_index + 1].T) * derivative
+            derivative = self._derivative_buffers[layer_index]
+            np.square(activations[layer_index + 1], out=derivative)
+            np.subtract(1.0, derivative, out=derivative)
+            delta = delta @ self._weights[layer_index + 1].T
+            delta *= derivative
             layer_activation = activations[layer_index]
             if np.allclose(layer_activation, 0.0):
                 layer_activation = np.ones_like(layer_activation)
-            weight_updates[layer_index] = self.learning_rate * np.outer(layer_activation, delta)
-            bias_updates[layer_index] = self.learning_rate * delta
+            np.multiply(layer_activation[:, np.newaxis], delta, out=weight_updates[layer_index])
+            bias = self._biases[layer_index]
+            bias += learning_rate * delta
 
-        self._weights = tuple(base + update for base, update in zip(self._weights, weight_updates))
-        self._biases = tuple(base + update for base, update in zip(self._biases, bias_updates))
+        # Every weight update above was computed from the pre-update weights, so apply them in place now.
+        for weight, update in zip(self._weights, weight_updates):
+            update *= learning_rate
+            weight += update
 
     def exploration_rate(self, actor_id: int | None = None) -> float:
         key = 0 if actor_id is None else actor_id
         return self._epsilon_for(key)
 
     def _epsilon_for(self, actor_id: int) -> float:
-        epsilon = self._epsilon_values.get(actor_id)
-        if epsilon is None:
-            epsilon = self.epsilon_start
-            self._epsilon_values[actor_id] = epsilon
-        return epsilon
+        if actor_id < 0:
+            raise ValueError("actor_id must be non-negative")
+        if actor_id >= self._epsilon_values.size:
+            self._grow_epsilon_values(actor_id + 1)
+        return float(self._epsilon_values[actor_id])
 
     def _decay_epsilon(self, actor_id: int) -> None:
         current = self._epsilon_for(actor_id)
         self._epsilon_values[actor_id] = max(self.epsilon_min, current * self.epsilon_decay)
 
+    def _grow_epsilon_values(self, size: int) -> None:
+        padding = np.full(size - self._epsilon_values.size, self.epsilon_start, dtype=np.float32)
+        self._epsilon_values = np.concatenate((self._epsilon_values, padding))
+
     def randomize_weights(self) -> None:
-        rng = np.random.default_rng()
-        self._weights, self._biases = self._initialize_parameters(rng)
+        self._fill_parameters(self._rng)
         self._reset_exploration_rates()
 
     def randomize_percentile_weights(self, percentile: float) -> None:
@@ -142,73 +211,50 @@ class NeuralPolicyAgent:
         if combined.size == 0:
             return
 
-        threshold = float(np.percentile(combined, percentile))
-        rng = np.random.default_rng()
-
-        updated_weights = []
-        updated_biases = []
-        fan_in = self.state_size
+        threshold = float(np.percentile(combined, percentile, method="lower"))
+        rng = self._rng
 
-        for layer_index in range(self.hidden_layers):
-            weight = self._weights[layer_index].copy()
-            bias = self._biases[layer_index].copy()
-            layer_scale = self._layer_scale(fan_in)
+        for weight, bias in zip(self._weights, self._biases):
+            layer_scale = self._layer_scale(weight.shape[0])
 
             mask = np.abs(weight) <= threshold
             if np.any(mask):
-                weight[mask] = rng.normal(0.0, layer_scale, size=int(np.count_nonzero(mask))).astype(np.float32)
+                weight[mask] = rng.normal(0.0, layer_scale, size=int(np.count_nonzero(mask)))
 
             bias_mask = np.abs(bias) <= threshold
             if np.any(bias_mask):
-                bias[bias_mask] = rng.normal(0.0, layer_scale, size=int(np.count_nonzero(bias_mask))).astype(np.float32)
-
-            updated_weights.append(weight.astype(np.float32, copy=False))
-            updated_biases.append(bias.astype(np.float32, copy=False))
-            fan_in = self.hidden_size
+                bias[bias_mask] = rng.normal(0.0, layer_scale, size=int(np.count_nonzero(bias_mask)))
 
-        output_weight = self._weights[-1].copy()
-        output_bias = self._biases[-1].copy()
-        output_scale = self._layer_scale(fan_in)
-
-        mask = np.abs(output_weight) <= threshold
-        if np.any(mask):
-            output_weight[mask] = rng.normal(0.0, output_scale, size=int(np.count_nonzero(mask))).astype(np.float32)
+        self._reset_exploration_rates()
 
-        bias_mask = np.abs(output_bias) <= threshold
-        if np.any(bias_mask):
-            output_bias[bias_mask] = rng.normal(0.0, output_scale, size=int(np.count_nonzero(bias_mask))).astype(np.float32)
+    def _layer_shapes(self) -> list[tuple[int, int]]:
+        fan_ins = [self.state_size] + [self.hidden_size] * self.hidden_layers
+        fan_outs = [self.hidden_size] * self.hidden_layers + [self.action_size]
+        return list(zip(fan_ins, fan_outs))
 
-        updated_weights.append(output_weight.astype(np.float32, copy=False))
-        updated_biases.append(output_bias.astype(np.float32, copy=False))
+    def _allocate_parameters(self) -> None:
+        """Allocate one contiguous float32 buffer holding every weight and bias."""
+        total = sum(fan_in * fan_out + fan_out for fan_in, fan_out in self._layer_shapes())
+        self._parameters = np.empty(total, dtype=np.float32)
+        self._bind_parameter_views()
 
-        self._weights = tuple(updated_weights)
-        self._biases = tuple(updated_biases)
-        self._reset_exploration_rates()
-
-    def _initialize_parameters(
-        self,
-        rng: np.random.Generator,
-    ) -> tuple[tuple[np.ndarray, ...], tuple[np.ndarray, ...]]:
+    def _bind_parameter_views(self) -> None:
         weights = []
         biases = []
-
-        fan_in = self.state_size
-        for _ in range(self.hidden_layers):
-            scale = self._layer_scale(fan_in)
-            weight = rng.normal(0.0, scale, size=(fan_in, self.hidden_size)).astype(np.float32)
-            bias = rng.normal(0.0, scale, size=self.hidden_size).astype(np.float32)
-            weights.append(weight)
-            biases.append(bias)
-            fan_in = self.hidden_size
-
-        output_scale = self._layer_scale(fan_in)
-        output_weight = rng.normal(0.0, output_scale, size=(fan_in, self.action_size)).astype(np.float32)
-        output_bias = rng.normal(0.0, output_scale, size=self.action_size).astype(np.float32)
-
-        weights.append(output_weight)
-        biases.append(output_bias)
-
-        return tuple(weights), tuple(biases)
+        offset = 0
+        for fan_in, fan_out in self._layer_shapes():
+            weights.append(self._parameters[offset : offset + fan_in * fan_out].reshape(fan_in, fan_out))
+            offset += fan_in * fan_out
+            biases.append(self._parameters[offset : offset + fan_out])
+            offset += fan_out
+        self._weight_views = tuple(weights)
+        self._bias_views = tuple(biases)
+
+    def _fill_parameters(self, rng: np.random.Generator) -> None:
+        for weight, bias in zip(self._weight_views, self._bias_views):
+            scale = self._layer_scale(weight.shape[0])
+            weight[...] = rng.normal(0.0, scale, size=weight.shape)
+            bias[...] = rng.normal(0.0, scale, size=bias.shape)
 
     @staticmethod
     def _layer_scale(fan_in: int) -> float:
@@ -217,8 +263,6 @@ class NeuralPolicyAgent:
         return math.sqrt(2.0 / fan_in)
 
     def _reset_exploration_rates(self) -> None:
-        if not self._epsilon_values:
-            return
-        self._epsilon_values = {actor_id: self.epsilon_start for actor_id in self._epsilon_values}
+        self._epsilon_values.fill(self.epsilon_start)
 
 
@@ -10,7 +10,7 @@ import numpy as np
 
 import gymnasium as gym
 import torch
-from torch.distributions import Categorical
+import torch.nn.functional as F
 
 try:
     import pufferlib.pytorch as _puffer_torch
@@ -31,13 +31,14 @@ else:  # pragma: no cover - smoke tests rely on shim path
 
 
 _FLOAT_DTYPE = np.float32
+_DEVICE = torch.device("cpu")
 
 
 @dataclass
 class _Trace:
     """Stores transition data for a single actor."""
 
-    state: torch.Tensor
+    state: np.ndarray
     action: int
 
 
@@ -56,7 +57,7 @@ class _CollectEnvSpec:
 class _DensePolicy(torch.nn.Module):
     """Two-layer MLP policy for Collect."""
 
-    def __init__(self, spec: _CollectEnvSpec, hidden_size: int) -> None:
+    def __init__(self, spec: _CollectEnvSpec, hidden_size: int, compile_encoder: bool = False) -> None:
         super().__init__()
         observation_shape = spec.single_observation_space.shape
         if len(observation_shape) != 1:
@@ -72,6 +73,9 @@ class _DensePolicy(torch.nn.Module):
             _layer_init(torch.nn.Linear(hidden_size, hidden_size)),
             torch.nn.GELU(),
         )
+        # Compile the bound forward rather than the module so ``_encoder`` stays a plain Sequential
+        # and no second submodule (or state_dict entry) is registered.
+        self._compiled_encode = torch.compile(self._encoder.forward, dynamic=False) if compile_encoder else None
         self._policy_head = _layer_init(
             torch.nn.Linear(hidden_size, action_dim),
             std=0.01,
@@ -93,7 +97,7 @@ class _DensePolicy(torch.nn.Module):
             raise ValueError("Observations must include a batch dimension")
         batch_size = observations.shape[0]
         flattened = observations.view(batch_size, -1)
-        return self._encoder(flattened.float())
+        return (self._compiled_encode or self._encoder)(flattened.float())
 
     def decode_actions(self, hidden: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
         logits = self._policy_head(hidden)
@@ -114,6 +118,7 @@ class CollectPufferAgent:
         value_coef: float = 0.5,
         max_grad_norm: float = 1.0,
         discount: float = 0.99,
+        compile_encoder: bool = False,
     ) -> None:
         if state_size <= 0:
             raise ValueError("state_size must be positive")
@@ -122,9 +127,9 @@ class CollectPufferAgent:
         if discount < 0.0 or discount > 1.0:
             raise ValueError("discount must be between 0.0 and 1.0")
 
-        self._device = torch.device("cpu")
+        self._device = _DEVICE
         self._spec = _CollectEnvSpec(state_size, action_size)
-        self._policy = _DensePolicy(self._spec, hidden_size=hidden_size).to(self._device)
+        self._policy = _DensePolicy(self._spec, hidden_size=hidden_size, compile_encoder=compile_encoder).to(self._device)
         self._policy.train()
         self._optimizer = torch.optim.Adam(self._policy.parameters(), lr=learning_rate)
         self._entropy_coef = float(entropy_coef)
@@ -135,13 +140,12 @@ class CollectPufferAgent:
 
     def act(self, state: Sequence[float], actor_id: int = 0) -> int:
         state_array = self._to_state_array(state)
-        state_tensor = torch.from_numpy(state_array).to(self._device)
-        logits, _ = self._policy.forward_eval(state_tensor.unsqueeze(0))
-        logits = logits.squeeze(0)
-        distribution = Categorical(logits=logits)
-        action_tensor = distribution.sample()
-        action = int(action_tensor.item())
-        self._traces[actor_id] = _Trace(state=state_tensor.detach(), action=action)
+        with torch.inference_mode():
+            state_tensor = torch.from_numpy(state_array).to(self._device)
+            logits, _ = self._policy.forward_eval(state_tensor.unsqueeze(0))
+            log_probs = F.log_softmax(logits.squeeze(0), dim=-1)
+            action = int(torch.multinomial(log_probs.exp(), 1).item())
+        self._traces[actor_id] = _Trace(state=state_array, action=action)
         return action
 
     def learn(self, reward: float, next_state: Sequence[float], done: bool, actor_id: int = 0) -> None:
@@ -150,7 +154,7 @@ class CollectPufferAgent:
             return
 
         reward_tensor = torch.tensor(float(reward), dtype=torch.float32, device=self._device)
-        state_tensor = trace.state.unsqueeze(0)
+        state_tensor = torch.from_numpy(trace.state).to(self._device).unsqueeze(0)
 
         logits, value = self._policy(state_tensor)
         logits = logits.squeeze(0)
@@ -161,19 +165,20 @@ class CollectPufferAgent:
         else:
             next_state_array = self._to_state_array(next_state)
             next_state_tensor = torch.from_numpy(next_state_array).to(self._device)
-            with torch.no_grad():
+            with torch.inference_mode():
                 _, next_value = self._policy.forward_eval(next_state_tensor.unsqueeze(0))
-            next_value = next_value.squeeze(0)
-            target_value = reward_tensor + self._discount * next_value
+                target_value = reward_tensor + self._discount * next_value.squeeze(0)
+            # Inference tensors cannot be saved for backward; clone turns the target into an ordinary constant.
+            target_value = target_value.clone()
 
         advantage = target_value - value
 
-        distribution = Categorical(logits=logits)
-        log_prob = distribution.log_prob(torch.tensor(trace.action, device=self._device))
+        log_probs = F.log_softmax(logits, dim=-1)
+        log_prob = log_probs[trace.action]
 
         policy_loss = -log_prob * advantage.detach()
         value_loss = 0.5 * advantage.pow(2)
-        entropy_loss = distribution.entropy()
+        entropy_loss = -(log_probs.exp() * log_probs).sum()
 
         loss = policy_loss + self._value_coef * value_loss - self._entropy_coef * entropy_loss
 
@@ -21,15 +21,34 @@ from .config import (
 from .types import Player
 
 
+_CELL_CENTER_OFFSET_PX = CELL_SIZE_PX // 2
+_CELL_CENTERS_X: tuple[int, ...] = tuple(
+    x * CELL_SIZE_PX + _CELL_CENTER_OFFSET_PX for x in range(FIELD_DIMENSIONS.width)
+)
+_CELL_CENTERS_Y: tuple[int, ...] = tuple(
+    y * CELL_SIZE_PX + _CELL_CENTER_OFFSET_PX for y in range(FIELD_DIMENSIONS.height)
+)
+
+
 class Renderer:
     """Renders the current game state onto a pygame surface."""
 
+    _TEXT_CACHE_SIZE = 64
+
     def __init__(self, surface: "pygame.Surface", font: "pygame.font.Font") -> None:  # type: ignore[name-defined]
         if pygame is None:
             raise RuntimeError("pygame is required for rendering; install pygame to draw the game")
         self._surface = surface
         self._font = font
         self._grid_surface = self._build_grid_surface()
+        radius = CELL_SIZE_PX // 2
+        self._player_sprite = self._build_sprite(PLAYER_COLOR, radius)
+        self._carried_resource_sprite = self._build_sprite(RESOURCE_COLOR, radius // 2)
+        self._resource_sprite = self._build_sprite(RESOURCE_COLOR, radius)
+        self._target_sprite = self._build_sprite(TARGET_COLOR, radius, width=1)
+        self._monster_sprite = self._build_sprite(MONSTER_COLOR, max(1, radius))
+        self._text_cache: dict[str, pygame.Surface] = {}
+        self._last_frame_key: tuple[object, ...] | None = None
 
     def draw(
         self,
@@ -43,13 +62,7 @@ class Renderer:
         epsilon_percentages: dict[int, float] | None = None,
         rolling_rewards: dict[int, float] | None = None,
     ) -> None:
-        self._surface.blit(self._grid_surface, (0, 0))
-        for player in players:
-            self._draw_player(player)
-        self._draw_resources(resources)
-        self._draw_target(target)
-        self._draw_monster(monster)
-        self._draw_hud(
+        hud_text = self._hud_text(
             players,
             round_seconds_remaining,
             paused,
@@ -57,6 +70,19 @@ class Renderer:
             epsilon_percentages,
             rolling_rewards,
         )
+        frame_key = (players, resources, monster, target, hud_text)
+        if frame_key != self._last_frame_key:
+            self._last_frame_key = frame_key
+            self._surface.blit(self._grid_surface, (0, 0))
+            blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+            for player in players:
+                blits.extend(self._player_blits(player))
+            blits.extend(self._resource_blits(resources))
+            blits.append(self._sprite_blit(self._target_sprite, target))
+            blits.append(self._sprite_blit(self._monster_sprite, monster))
+            self._surface.blits(blits, doreturn=False)
+            self._draw_hud(hud_text)
+        # Always present the surface so an uncovered or restored window is repainted while the frame is static.
         pygame.display.flip()
 
     def _build_grid_surface(self) -> pygame.Surface:
@@ -65,57 +91,57 @@ class Renderer:
         grid_surface = pygame.Surface((width, height))
         grid_surface.fill(BACKGROUND_COLOR)
         for x_pos in range(0, width, CELL_SIZE_PX):
-            pygame.draw.line(grid_surface, GRID_COLOR, (x_pos, 0), (x_pos, height))
+            grid_surface.fill(GRID_COLOR, pygame.Rect(x_pos, 0, 1, height))
         for y_pos in range(0, height, CELL_SIZE_PX):
-            pygame.draw.line(grid_surface, GRID_COLOR, (0, y_pos), (width, y_pos))
-        return grid_surface
+            grid_surface.fill(GRID_COLOR, pygame.Rect(0, y_pos, width, 1))
+        return grid_surface.convert()
 
-    def _draw_player(self, player: Player) -> None:
-        px, py = self._cell_to_pixels(player.position)
-        radius = CELL_SIZE_PX // 2
-        pygame.draw.circle(self._surface, PLAYER_COLOR, (px, py), radius, width=0)
-        if player.has_resource:
-            pygame.draw.circle(self._surface, RESOURCE_COLOR, (px, py), radius // 2, width=0)
+    def _build_sprite(self, color: tuple[int, int, int], radius: int, width: int = 0) -> pygame.Surface:
+        size = 2 * radius + 1
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius, width=width)
+        return sprite.convert_alpha()
 
-    def _draw_resources(self, resources: tuple[tuple[int, int], ...]) -> None:
-        radius = CELL_SIZE_PX // 2
-        for resource in resources:
-            rx, ry = self._cell_to_pixels(resource)
-            pygame.draw.circle(self._surface, RESOURCE_COLOR, (rx, ry), radius, width=0)
-
-    def _draw_target(self, target: tuple[int, int]) -> None:
-        tx, ty = self._cell_to_pixels(target)
-        radius = CELL_SIZE_PX // 2
-        pygame.draw.circle(self._surface, TARGET_COLOR, (tx, ty), radius, width=1)
-
-    def _draw_monster(self, monster: tuple[int, int]) -> None:
-        mx, my = self._cell_to_pixels(monster)
-        radius = max(1, CELL_SIZE_PX // 2)
-        pygame.draw.circle(self._surface, MONSTER_COLOR, (mx, my), radius, width=0)
+    def _sprite_blit(
+        self,
+        sprite: pygame.Surface,
+        cell: tuple[int, int],
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        offset = sprite.get_width() // 2
+        return sprite, (_CELL_CENTERS_X[cell[0]] - offset, _CELL_CENTERS_Y[cell[1]] - offset)
+
+    def _player_blits(self, player: Player) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        blits = [self._sprite_blit(self._player_sprite, player.position)]
+        if player.has_resource:
+            blits.append(self._sprite_blit(self._carried_resource_sprite, player.position))
+        return blits
 
-    def _draw_hud(
+    def _resource_blits(
         self,
-        players: tuple[Player, ...],
-        round_seconds_remaining: float,
-        paused: bool,
-        rolling_scores: dict[int, int] | None,
-        epsilon_percentages: dict[int, float] | None,
-        rolling_rewards: dict[int, float] | None,
-    ) -> None:
-        hud_text = self._hud_text(
-            players,
-            round_seconds_remaining,
-            paused,
-            rolling_scores,
-            epsilon_percentages,
-            rolling_rewards,
-        )
+        resources: tuple[tuple[int, int], ...],
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        sprite = self._resource_sprite
+        offset = sprite.get_width() // 2
+        centers_x = _CELL_CENTERS_X
+        centers_y = _CELL_CENTERS_Y
+        return [(sprite, (centers_x[x_cell] - offset, centers_y[y_cell] - offset)) for x_cell, y_cell in resources]
+
+    def _draw_hud(self, hud_text: str) -> None:
         if not hud_text:
             return
         line_height = self._font.get_linesize()
         for index, line in enumerate(hud_text.splitlines()):
-            hud_surface = self._font.render(line, True, TEXT_COLOR)
-            self._surface.blit(hud_surface, (10, 10 + index * line_height))
+            self._surface.blit(self._render_text(line), (10, 10 + index * line_height))
+
+    def _render_text(self, line: str) -> pygame.Surface:
+        cached = self._text_cache.get(line)
+        if cached is not None:
+            return cached
+        if len(self._text_cache) >= self._TEXT_CACHE_SIZE:
+            del self._text_cache[next(iter(self._text_cache))]
+        rendered = self._font.render(line, True, TEXT_COLOR).convert_alpha()
+        self._text_cache[line] = rendered
+        return rendered
 
     def _hud_text(
         self,
@@ -126,21 +152,25 @@ class Renderer:
         epsilon_percentages: dict[int, float] | None,
         rolling_rewards: dict[int, float] | None = None,
     ) -> str:
+        seconds = max(0, int(seconds_remaining))
+        lines = [f"{seconds}s"]
+        if rolling_scores is None and epsilon_percentages is None and rolling_rewards is None:
+            for player in players:
+                lines.append(f"{player.identifier}: {player.score}")
+            return "\n".join(lines)
         epsilon_lookup = epsilon_percentages or {}
         rolling_lookup = rolling_scores or {}
         reward_lookup = rolling_rewards or {}
-        player_lines = [
-            self._player_fragment(
-                player,
-                rolling_lookup.get(player.identifier),
-                epsilon_lookup.get(player.identifier),
-                reward_lookup.get(player.identifier),
+        for player in players:
+            identifier = player.identifier
+            lines.append(
+                self._player_fragment(
+                    player,
+                    rolling_lookup.get(identifier),
+                    epsilon_lookup.get(identifier),
+                    reward_lookup.get(identifier),
+                )
             )
-            for player in players
-        ]
-        seconds = max(0, int(seconds_remaining))
-        lines = [f"{seconds}s"]
-        lines.extend(player_lines)
         return "\n".join(lines)
 
     def _player_fragment(
@@ -160,9 +190,3 @@ class Renderer:
             fragments.append(f"rr:{rolling_reward:+.2f}")
         return " ".join(fragments)
 
-    def _cell_to_pixels(self, cell: tuple[int, int]) -> tuple[int, int]:
-        cx, cy = cell
-        x_px = cx * CELL_SIZE_PX + CELL_SIZE_PX // 2
-        y_px = cy * CELL_SIZE_PX + CELL_SIZE_PX // 2
-        return x_px, y_px
-
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import math
-from collections import defaultdict, deque
+import bisect
 from dataclasses import dataclass
-from typing import Deque, Dict
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -21,15 +20,19 @@ class RollingReward:
         if window_seconds < 0:
             raise ValueError("window_seconds must be non-negative")
         self._window = float(window_seconds)
-        self._buckets: Dict[int, Deque[_RewardBucket]] = defaultdict(deque)
-        self._current: Dict[int, _RewardBucket] = {}
-        self._sums: Dict[int, float] = defaultdict(float)
+        # Per-player state lives in dense lists indexed by the (small, non-negative) identifier.
+        # Committed buckets are stored as parallel, second-ordered lists per player.
+        self._seconds: List[List[int]] = []
+        self._bucket_totals: List[List[float]] = []
+        self._current: List[Optional[_RewardBucket]] = []
+        self._sums: List[float] = []
 
     def record(self, player_identifier: int, timestamp: float, reward: float) -> None:
-        if math.isclose(reward, 0.0):
+        if reward == 0.0:
             return
+        self._ensure(player_identifier)
         second = int(timestamp)
-        current_bucket = self._current.get(player_identifier)
+        current_bucket = self._current[player_identifier]
 
         if current_bucket is None:
             self._current[player_identifier] = _RewardBucket(second=second, total=reward)
@@ -46,82 +49,89 @@ class RollingReward:
             # Out-of-order timestamps are unexpected but handled defensively.
             self._commit(player_identifier, current_bucket)
             self._insert_historical(player_identifier, second, reward)
-            self._purge(player_identifier, timestamp)
+            self._purge(player_identifier, timestamp - self._window)
             return
 
-        self._purge(player_identifier, timestamp)
+        self._purge(player_identifier, timestamp - self._window)
 
     def total(self, player_identifier: int, current_time: float) -> float:
+        if player_identifier < 0 or player_identifier >= len(self._sums):
+            return 0.0
         self._finalize_if_needed(player_identifier, current_time)
-        self._purge(player_identifier, current_time)
-        return self._sums.get(player_identifier, 0.0)
+        self._purge(player_identifier, current_time - self._window)
+        return self._sums[player_identifier]
 
     def totals(self, current_time: float) -> Dict[int, float]:
         snapshot: Dict[int, float] = {}
-        for identifier in list(self._buckets.keys()):
-            total = self.total(identifier, current_time)
-            if not math.isclose(total, 0.0):
-                snapshot[identifier] = total
-        # Also consider identifiers that only have a pending current bucket.
-        for identifier, bucket in list(self._current.items()):
-            if identifier in snapshot:
-                continue
+        cutoff = current_time - self._window
+        for identifier in range(len(self._sums)):
             self._finalize_if_needed(identifier, current_time)
-            self._purge(identifier, current_time)
-            total = self._sums.get(identifier, 0.0)
-            if not math.isclose(total, 0.0):
+            self._purge(identifier, cutoff)
+            total = self._sums[identifier]
+            if total:
                 snapshot[identifier] = total
         return snapshot
 
     def reset(self) -> None:
-        self._buckets.clear()
+        self._seconds.clear()
+        self._bucket_totals.clear()
         self._current.clear()
         self._sums.clear()
 
+    def _ensure(self, player_identifier: int) -> None:
+        if player_identifier < 0:
+            raise ValueError("player_identifier must be non-negative")
+        for _ in range(len(self._sums), player_identifier + 1):
+            self._seconds.append([])
+            self._bucket_totals.append([])
+            self._current.append(None)
+            self._sums.append(0.0)
+
     def _commit(self, player_identifier: int, bucket: _RewardBucket) -> None:
-        if math.isclose(bucket.total, 0.0):
-            self._current.pop(player_identifier, None)
+        self._current[player_identifier] = None
+        if bucket.total == 0.0:
             return
-        self._buckets[player_identifier].append(bucket)
+        seconds = self._seconds[player_identifier]
+        if seconds and bucket.second <= seconds[-1]:
+            self._insert_historical(player_identifier, bucket.second, bucket.total)
+            return
+        seconds.append(bucket.second)
+        self._bucket_totals[player_identifier].append(bucket.total)
         self._sums[player_identifier] += bucket.total
-        self._current.pop(player_identifier, None)
 
     def _insert_historical(self, player_identifier: int, second: int, reward: float) -> None:
-        buckets = self._buckets[player_identifier]
-        for index, existing in enumerate(buckets):
-            if existing.second == second:
-                existing.total += reward
-                self._sums[player_identifier] += reward
-                return
-            if second < existing.second:
-                buckets.insert(index, _RewardBucket(second=second, total=reward))
-                self._sums[player_identifier] += reward
-                return
-        buckets.append(_RewardBucket(second=second, total=reward))
+        seconds = self._seconds[player_identifier]
+        bucket_totals = self._bucket_totals[player_identifier]
+        index = bisect.bisect_left(seconds, second)
+        if index < len(seconds) and seconds[index] == second:
+            bucket_totals[index] += reward
+        else:
+            seconds.insert(index, second)
+            bucket_totals.insert(index, reward)
         self._sums[player_identifier] += reward
 
     def _finalize_if_needed(self, player_identifier: int, current_time: float) -> None:
-        bucket = self._current.get(player_identifier)
+        bucket = self._current[player_identifier]
         if bucket is None:
             return
         if int(current_time) > bucket.second:
             self._commit(player_identifier, bucket)
 
-    def _purge(self, player_identifier: int, current_time: float) -> None:
+    def _purge(self, player_identifier: int, cutoff: float) -> None:
+        seconds = self._seconds[player_identifier]
+        bucket_totals = self._bucket_totals[player_identifier]
         if self._window == 0.0:
-            self._buckets[player_identifier].clear()
+            seconds.clear()
+            bucket_totals.clear()
             self._sums[player_identifier] = 0.0
-            self._current.pop(player_identifier, None)
+            self._current[player_identifier] = None
             return
-        cutoff = current_time - self._window
-        buckets = self._buckets[player_identifier]
-        while buckets and buckets[0].second + 1.0 <= cutoff:
-            expired = buckets.popleft()
-            self._sums[player_identifier] -= expired.total
-        if not buckets and player_identifier not in self._current:
-            self._sums.pop(player_identifier, None)
-            return
-        current_sum = self._sums.get(player_identifier)
-        if current_sum is not None and math.isclose(current_sum, 0.0) and not buckets:
-            self._sums.pop(player_identifier, None)
-
+        # A bucket expires once its whole second (second + 1) is at or before the cutoff.
+        expired_count = bisect.bisect_right(seconds, cutoff - 1.0)
+        if expired_count:
+            self._sums[player_identifier] -= sum(bucket_totals[:expired_count])
+            del seconds[:expired_count]
+            del bucket_totals[:expired_count]
+        if not seconds:
+            # Drop accumulated rounding error once every committed bucket has expired.
+            self._sums[player_identifier] = 0.0
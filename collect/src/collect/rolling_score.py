@@ -2,48 +2,86 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
-from typing import Deque, Dict
+import bisect
+from typing import Dict, List
 
 
 class RollingScore:
-    """Tracks per-player delivery counts within a rolling time window."""
+    """Tracks per-player delivery counts aggregated by second within a rolling window."""
 
     def __init__(self, window_seconds: float) -> None:
         if window_seconds < 0:
             raise ValueError("window_seconds must be non-negative")
         self._window = float(window_seconds)
-        self._events: Dict[int, Deque[float]] = defaultdict(deque)
+        # Per-player state lives in dense lists indexed by the (small, non-negative) identifier.
+        # Buckets are stored as parallel, second-ordered lists per player.
+        self._seconds: List[List[int]] = []
+        self._bucket_counts: List[List[int]] = []
+        self._counts: List[int] = []
 
     def record(self, player_identifier: int, timestamp: float, count: int = 1) -> None:
         if count <= 0:
             return
-        events = self._events[player_identifier]
-        for _ in range(count):
-            events.append(float(timestamp))
+        self._ensure(player_identifier)
+        second = int(timestamp)
+        seconds = self._seconds[player_identifier]
+        bucket_counts = self._bucket_counts[player_identifier]
+        self._counts[player_identifier] += count
+        if not seconds or second > seconds[-1]:
+            seconds.append(second)
+            bucket_counts.append(count)
+            return
+        if second == seconds[-1]:
+            bucket_counts[-1] += count
+            return
+        # Out-of-order timestamps are unexpected but handled defensively.
+        index = bisect.bisect_left(seconds, second)
+        if seconds[index] == second:
+            bucket_counts[index] += count
+        else:
+            seconds.insert(index, second)
+            bucket_counts.insert(index, count)
 
     def total(self, player_identifier: int, current_time: float) -> int:
-        self._purge(player_identifier, current_time)
-        return len(self._events[player_identifier])
+        if player_identifier < 0 or player_identifier >= len(self._counts):
+            return 0
+        self._purge(player_identifier, current_time - self._window)
+        return self._counts[player_identifier]
 
     def totals(self, current_time: float) -> Dict[int, int]:
         snapshot: Dict[int, int] = {}
-        for identifier in list(self._events.keys()):
-            total = self.total(identifier, current_time)
+        cutoff = current_time - self._window
+        for identifier in range(len(self._counts)):
+            self._purge(identifier, cutoff)
+            total = self._counts[identifier]
             if total:
                 snapshot[identifier] = total
         return snapshot
 
     def reset(self) -> None:
-        self._events.clear()
+        self._seconds.clear()
+        self._bucket_counts.clear()
+        self._counts.clear()
+
+    def _ensure(self, player_identifier: int) -> None:
+        if player_identifier < 0:
+            raise ValueError("player_identifier must be non-negative")
+        for _ in range(len(self._counts), player_identifier + 1):
+            self._seconds.append([])
+            self._bucket_counts.append([])
+            self._counts.append(0)
 
-    def _purge(self, player_identifier: int, current_time: float) -> None:
+    def _purge(self, player_identifier: int, cutoff: float) -> None:
+        seconds = self._seconds[player_identifier]
+        bucket_counts = self._bucket_counts[player_identifier]
         if self._window == 0.0:
-            self._events[player_identifier].clear()
+            seconds.clear()
+            bucket_counts.clear()
+            self._counts[player_identifier] = 0
             return
-        cutoff = current_time - self._window
-        events = self._events[player_identifier]
-        while events and events[0] < cutoff:
-            events.popleft()
-
-
+        # A bucket expires once its whole second (second + 1) is at or before the cutoff.
+        expired_count = bisect.bisect_right(seconds, cutoff - 1.0)
+        if expired_count:
+            self._counts[player_identifier] -= sum(bucket_counts[:expired_count])
+            del seconds[:expired_count]
+            del bucket_counts[:expired_count]
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Dict, Iterable, Optional, Tuple
 
+import numpy as np
+
 from .config import FIELD_DIMENSIONS
 
 
@@ -34,19 +36,21 @@ class Action(Enum):
 
     @staticmethod
     def from_delta(delta_x: int, delta_y: int) -> "Action":
+        action = _DELTA_TO_ACTION.get((delta_x, delta_y))
+        if action is not None:
+            return action
         clamped_x = max(-1, min(1, delta_x))
         clamped_y = max(-1, min(1, delta_y))
-        mapping: Dict[Tuple[int, int], Action] = {
-            action.value: action
-            for action in Action
-        }
-        return mapping[(clamped_x, clamped_y)]
+        return _DELTA_TO_ACTION[(clamped_x, clamped_y)]
+
+
+_DELTA_TO_ACTION: Dict[Tuple[int, int], Action] = {action.value: action for action in Action}
 
 
 GridPosition = Tuple[int, int]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Player:
     """Represents a player in the game."""
 
@@ -59,35 +63,17 @@ class Player:
     def with_position(self, position: GridPosition) -> "Player":
         if position == self.position:
             return self
-        return Player(
-            identifier=self.identifier,
-            position=position,
-            controller=self.controller,
-            has_resource=self.has_resource,
-            score=self.score,
-        )
+        return Player(self.identifier, position, self.controller, self.has_resource, self.score)
 
     def with_resource(self, has_resource: bool) -> "Player":
         if has_resource == self.has_resource:
             return self
-        return Player(
-            identifier=self.identifier,
-            position=self.position,
-            controller=self.controller,
-            has_resource=has_resource,
-            score=self.score,
-        )
+        return Player(self.identifier, self.position, self.controller, has_resource, self.score)
 
     def with_score(self, score: int) -> "Player":
         if score == self.score:
             return self
-        return Player(
-            identifier=self.identifier,
-            position=self.position,
-            controller=self.controller,
-            has_resource=self.has_resource,
-            score=score,
-        )
+        return Player(self.identifier, self.position, self.controller, self.has_resource, score)
 
 
 def _distance_squared(a: GridPosition, b: GridPosition) -> int:
@@ -96,10 +82,8 @@ def _distance_squared(a: GridPosition, b: GridPosition) -> int:
     return delta_x * delta_x + delta_y * delta_y
 
 
-def _normalise_offset(delta: int, limit: int) -> float:
-    if limit <= 0:
-        return 0.0
-    return delta / float(limit)
+_INV_WIDTH_SPAN = 1.0 / max(1, FIELD_DIMENSIONS.width - 1)
+_INV_HEIGHT_SPAN = 1.0 / max(1, FIELD_DIMENSIONS.height - 1)
 
 
 class Observation:
@@ -112,9 +96,11 @@ class Observation:
         "target",
         "monster",
         "_vector",
+        "_array",
     )
 
     _VECTOR_LENGTH = 9
+    _ZERO_OFFSET: Tuple[float, float] = (0.0, 0.0)
 
     def __init__(
         self,
@@ -131,6 +117,7 @@ class Observation:
         self.target = target
         self.monster = monster
         self._vector = self._compute_vector()
+        self._array: Optional[np.ndarray] = None
 
     @classmethod
     def vector_length(cls) -> int:
@@ -139,52 +126,59 @@ class Observation:
     def as_vector(self) -> Tuple[float, ...]:
         return self._vector
 
+    @property
+    def vector(self) -> np.ndarray:
+        """Float32 view of the encoded features, built once and shared by agents."""
+        array = self._array
+        if array is None:
+            array = np.array(self._vector, dtype=np.float32)
+            self._array = array
+        return array
+
     def _compute_vector(self) -> Tuple[float, ...]:
         player_position = self.player.position
-        width_span = max(1, FIELD_DIMENSIONS.width - 1)
-        height_span = max(1, FIELD_DIMENSIONS.height - 1)
-
-        resource_offset = self._nearest_resource_offset(player_position, width_span, height_span)
-        target_offset = self._position_offset(self.target, player_position, width_span, height_span)
-        nearest_player_offset = self._nearest_player_offset(player_position, width_span, height_span)
-        monster_offset = self._position_offset(self.monster, player_position, width_span, height_span)
-        has_resource = 1.0 if self.player.has_resource else 0.0
+        origin_x, origin_y = player_position
+        target_x, target_y = self.target
+        monster_x, monster_y = self.monster
+        resource_offset = self._nearest_resource_offset(player_position)
+        nearest_player_offset = self._nearest_player_offset(player_position)
 
         return (
             resource_offset[0],
             resource_offset[1],
-            target_offset[0],
-            target_offset[1],
+            (target_x - origin_x) * _INV_WIDTH_SPAN,
+            (target_y - origin_y) * _INV_HEIGHT_SPAN,
             nearest_player_offset[0],
             nearest_player_offset[1],
-            monster_offset[0],
-            monster_offset[1],
-            has_resource,
+            (monster_x - origin_x) * _INV_WIDTH_SPAN,
+            (monster_y - origin_y) * _INV_HEIGHT_SPAN,
+            1.0 if self.player.has_resource else 0.0,
         )
 
-    def _nearest_resource_offset(
-        self,
-        player_position: GridPosition,
-        width_span: int,
-        height_span: int,
-    ) -> Tuple[float, float]:
+    def _nearest_resource_offset(self, player_position: GridPosition) -> Tuple[float, float]:
         nearest = self._nearest_position(player_position, self.resources)
         if nearest is None:
-            return (0.0, 0.0)
-        return self._position_offset(nearest, player_position, width_span, height_span)
-
-    def _nearest_player_offset(
-        self,
-        player_position: GridPosition,
-        width_span: int,
-        height_span: int,
-    ) -> Tuple[float, float]:
-        others = tuple(player for player in self.players if player.identifier != self.player.identifier)
-        candidates = tuple(player.position for player in others)
-        nearest = self._nearest_position(player_position, candidates)
+            return self._ZERO_OFFSET
+        return self._position_offset(nearest, player_position)
+
+    def _nearest_player_offset(self, player_position: GridPosition) -> Tuple[float, float]:
+        identifier = self.player.identifier
+        origin_x, origin_y = player_position
+        nearest: Optional[GridPosition] = None
+        nearest_distance = 0
+        for other in self.players:
+            if other.identifier == identifier:
+                continue
+            position = other.position
+            delta_x = position[0] - origin_x
+            delta_y = position[1] - origin_y
+            distance = delta_x * delta_x + delta_y * delta_y
+            if nearest is None or distance < nearest_distance:
+                nearest = position
+                nearest_distance = distance
         if nearest is None:
-            return (0.0, 0.0)
-        return self._position_offset(nearest, player_position, width_span, height_span)
+            return self._ZERO_OFFSET
+        return self._position_offset(nearest, player_position)
 
     def _nearest_position(
         self,
@@ -196,17 +190,8 @@ class Observation:
             return None
         return min(candidates, key=lambda position: _distance_squared(origin, position))
 
-    def _position_offset(
-        self,
-        position: GridPosition,
-        origin: GridPosition,
-        width_span: int,
-        height_span: int,
-    ) -> Tuple[float, float]:
-        delta_x = position[0] - origin[0]
-        delta_y = position[1] - origin[1]
+    def _position_offset(self, position: GridPosition, origin: GridPosition) -> Tuple[float, float]:
         return (
-            _normalise_offset(delta_x, width_span),
-            _normalise_offset(delta_y, height_span),
+            (position[0] - origin[0]) * _INV_WIDTH_SPAN,
+            (position[1] - origin[1]) * _INV_HEIGHT_SPAN,
         )
-
@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
+import importlib.util
 import pathlib
 
+import pytest
+
+from collect.types import ControllerType, Player
+
+
+# collect.puffer_agent imports torch and gymnasium unconditionally; skip its tests in one place when either is absent.
+_PUFFER_REQUIREMENTS = ("torch", "gymnasium")
+collect_ignore = (
+    [] if all(importlib.util.find_spec(name) is not None for name in _PUFFER_REQUIREMENTS) else ["test_puffer_agent.py"]
+)
+
 
 _ORIGINAL_IS_DIR = pathlib.Path.is_dir
 
@@ -19,3 +31,12 @@ def _safe_is_dir(path_obj: pathlib.Path) -> bool:
 
 pathlib.Path.is_dir = _safe_is_dir  # type: ignore[assignment]
 
+
+@pytest.fixture(scope="session")
+def base_player() -> Player:
+    return Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
+
+
+@pytest.fixture(scope="session")
+def second_player() -> Player:
+    return Player(identifier=1, position=(0, 0), controller=ControllerType.AI)
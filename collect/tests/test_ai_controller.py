@@ -4,61 +4,71 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pytest
 
-pytest.importorskip("numpy")
-
 from collect.ai_controller import AIController
 from collect.neural_agent import NeuralPolicyAgent
 from collect.types import ControllerType, Observation, Player
 
 
-def test_default_agent_uses_neural_when_flag_unset(monkeypatch: pytest.MonkeyPatch) -> None:
-    class DummyAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            self.args = args
-            self.kwargs = kwargs
-
-    monkeypatch.setattr("collect.ai_controller.CollectPufferAgent", DummyAgent, raising=False)
-    monkeypatch.delenv("COLLECT_USE_PUFFER", raising=False)
-
-    agent = AIController.default_agent()
-
-    assert isinstance(agent, NeuralPolicyAgent)
-
-
-def test_default_agent_uses_puffer_when_enabled(
-    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+class _DummyPufferAgent:
+    __slots__ = ("args", "kwargs")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.args = args
+        self.kwargs = kwargs
+
+    def act(self, *_: Any, **__: Any) -> int:
+        return 0
+
+
+@pytest.mark.parametrize(
+    ("puffer_available", "env_value", "expected_type", "expected_message"),
+    [
+        (True, None, NeuralPolicyAgent, None),
+        (True, "true", _DummyPufferAgent, "using PufferLib agent"),
+        (False, "1", NeuralPolicyAgent, "falling back to built-in neural agent"),
+    ],
+    ids=["flag-unset", "puffer-enabled", "puffer-missing"],
+)
+def test_default_agent_selection(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    puffer_available: bool,
+    env_value: str | None,
+    expected_type: type,
+    expected_message: str | None,
 ) -> None:
-    class DummyAgent:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            self.args = args
-            self.kwargs = kwargs
-
-        def act(self, *_: Any, **__: Any) -> int:
-            return 0
-
-    monkeypatch.setattr("collect.ai_controller.CollectPufferAgent", DummyAgent, raising=False)
-    monkeypatch.setenv("COLLECT_USE_PUFFER", "true")
+    monkeypatch.setattr(
+        "collect.ai_controller.CollectPufferAgent",
+        _DummyPufferAgent if puffer_available else None,
+        raising=False,
+    )
+    if env_value is None:
+        monkeypatch.delenv("COLLECT_USE_PUFFER", raising=False)
+    else:
+        monkeypatch.setenv("COLLECT_USE_PUFFER", env_value)
 
     agent = AIController.default_agent()
     captured = capsys.readouterr()
 
-    assert isinstance(agent, DummyAgent)
-    assert "using PufferLib agent" in captured.out
+    assert isinstance(agent, expected_type)
+    if expected_message is None:
+        assert captured.out == ""
+    else:
+        assert expected_message in captured.out
 
 
-def test_default_agent_falls_back_when_puffer_missing(
-    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
-) -> None:
-    monkeypatch.setattr("collect.ai_controller.CollectPufferAgent", None, raising=False)
+def test_default_agent_forwards_compile_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("collect.ai_controller.CollectPufferAgent", _DummyPufferAgent, raising=False)
     monkeypatch.setenv("COLLECT_USE_PUFFER", "1")
+    monkeypatch.setenv("COLLECT_TORCH_COMPILE", "yes")
 
     agent = AIController.default_agent()
-    captured = capsys.readouterr()
 
-    assert isinstance(agent, NeuralPolicyAgent)
-    assert "falling back to built-in neural agent" in captured.out
+    assert isinstance(agent, _DummyPufferAgent)
+    assert agent.kwargs["compile_encoder"] is True
 
 
 def test_controllers_use_distinct_agents() -> None:
@@ -73,10 +83,11 @@ def test_ai_controller_observe_forwards_terminal_flag() -> None:
 
     class DummyAgent:
         def __init__(self) -> None:
-            self.calls: list[tuple[float, tuple[float, ...], bool, int]] = []
+            self.calls: list[tuple[float, np.ndarray, bool, int]] = []
 
-        def learn(self, reward: float, next_state: tuple[float, ...], done: bool, actor_id: int) -> None:
-            self.calls.append((reward, tuple(next_state), done, actor_id))
+        def learn(self, reward: float, next_state: np.ndarray, done: bool, actor_id: int) -> None:
+            assert isinstance(next_state, np.ndarray)
+            self.calls.append((reward, next_state, done, actor_id))
 
     dummy_agent = DummyAgent()
     controller._agent = dummy_agent
@@ -90,10 +101,13 @@ def test_ai_controller_observe_forwards_terminal_flag() -> None:
         target=(3, 3),
     )
 
+    expected_vector = observation.vector
+
     controller.observe(1.5, observation, True)
     controller.observe(0.25, observation, False)
 
     assert dummy_agent.calls == [
-        (1.5, observation.as_vector(), True, 3),
-        (0.25, observation.as_vector(), False, 3),
+        (1.5, expected_vector, True, 3),
+        (0.25, expected_vector, False, 3),
     ]
+    assert all(state is expected_vector for _, state, _, _ in dummy_agent.calls)
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+import random
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from typing import Mapping, Sequence, TypeVar
+
+import numpy as np
 import pytest
 
-import collect.game as game_module
 from collect.ai_controller import AIController
 from collect.game import AgentFeedback, Game
 from collect.neural_agent import NeuralPolicyAgent
 from collect.types import Action, ControllerType, Observation, Player
 
 
+_T = TypeVar("_T")
+
+
 class DummyController:
+    __slots__ = ("calls",)
+
     def __init__(self) -> None:
         self.calls: list[tuple[float, Observation, bool]] = []
 
@@ -18,6 +27,15 @@ class DummyController:
         self.calls.append((reward, next_observation, is_terminal))
 
 
+@pytest.fixture
+def bare_game() -> Game:
+    game = Game.__new__(Game)
+    game._human_player_identifier = None
+    game._ai_controllers = {}
+    game._rng = random.Random(0)
+    return game
+
+
 def _observation_for(identifier: int) -> Observation:
     player = Player(identifier=identifier, position=(identifier, identifier), controller=ControllerType.AI)
     return Observation(
@@ -29,10 +47,17 @@ def _observation_for(identifier: int) -> Observation:
     )
 
 
-def test_game_apply_agent_feedback_forwards_terminal_flag() -> None:
+@pytest.fixture(scope="module")
+def feedback_observations() -> tuple[Observation, Observation]:
+    """Distinct terminal and ongoing observations, built once per module."""
+    return _observation_for(0), _observation_for(1)
+
+
+def test_game_apply_agent_feedback_forwards_terminal_flag(
+    bare_game: Game, feedback_observations: tuple[Observation, Observation]
+) -> None:
     controller = DummyController()
-    terminal_observation = _observation_for(0)
-    ongoing_observation = _observation_for(1)
+    terminal_observation, ongoing_observation = feedback_observations
 
     terminal_feedback = [
         AgentFeedback(controller=controller, reward=1.0, next_observation=terminal_observation),
@@ -41,8 +66,7 @@ def test_game_apply_agent_feedback_forwards_terminal_flag() -> None:
         AgentFeedback(controller=controller, reward=0.25, next_observation=ongoing_observation),
     ]
 
-    game = Game.__new__(Game)
-    game._human_player_identifier = None
+    game = bare_game
 
     game._apply_agent_feedback(terminal_feedback, True)
     game._apply_agent_feedback(ongoing_feedback, False)
@@ -51,18 +75,14 @@ def test_game_apply_agent_feedback_forwards_terminal_flag() -> None:
         (1.0, terminal_observation, True),
         (0.25, ongoing_observation, False),
     ]
+    assert controller.calls[0][1] is terminal_observation
+    assert controller.calls[1][1] is ongoing_observation
 
 
-def test_game_epsilon_by_player_returns_mapping() -> None:
-    game = Game.__new__(Game)
-    agent_a = NeuralPolicyAgent(
-        state_size=Observation.vector_length(),
-        action_size=len(Action),
-    )
-    agent_b = NeuralPolicyAgent(
-        state_size=Observation.vector_length(),
-        action_size=len(Action),
-    )
+def test_game_epsilon_by_player_returns_mapping(bare_game: Game) -> None:
+    game = bare_game
+    agent_a = NeuralPolicyAgent(state_size=Observation.vector_length(), action_size=len(Action))
+    agent_b = NeuralPolicyAgent(state_size=Observation.vector_length(), action_size=len(Action))
     agent_a._epsilon_values[0] = 0.4
     agent_b._epsilon_values[1] = 0.2
 
@@ -86,6 +106,8 @@ def test_game_epsilon_by_player_returns_mapping() -> None:
 
 
 class _StubController:
+    __slots__ = ("randomized", "called_percentiles")
+
     def __init__(self) -> None:
         self.randomized = False
         self.called_percentiles: list[float | None] = []
@@ -99,9 +121,17 @@ class _StubController:
         self.called_percentiles.append(percentile)
 
 
+@dataclass(frozen=True, slots=True)
+class _FakeState:
+    players: tuple[Player, ...]
+
+
 class _StubRollingScore:
+    __slots__ = ("values", "_frozen")
+
     def __init__(self, values: dict[int, int] | None = None) -> None:
         self.values = values or {}
+        self._frozen = MappingProxyType(self.values)
 
     def record(self, player_identifier: int, timestamp: float, count: int = 1) -> None:  # pragma: no cover - stub
         pass
@@ -109,28 +139,42 @@ class _StubRollingScore:
     def total(self, player_identifier: int, current_time: float) -> int:
         return self.values.get(player_identifier, 0)
 
-    def totals(self, current_time: float) -> dict[int, int]:
-        return dict(self.values)
+    def totals(self, current_time: float) -> Mapping[int, int]:
+        return self._frozen
+
+
+class _ScriptedRng:
+    """Replays fixed jitter draws and always picks the last remaining candidate."""
+
+    __slots__ = ("_draws", "_index")
+
+    def __init__(self, draws: np.ndarray) -> None:
+        self._draws = draws
+        self._index = 0
+
+    def random(self) -> float:
+        value = float(self._draws[self._index])
+        self._index += 1
+        return value
+
+    def choice(self, seq: Sequence[_T]) -> _T:
+        return seq[-1]
 
 
-def test_game_randomize_lowest_agent_respects_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_game_randomize_lowest_agent_respects_interval(bare_game: Game) -> None:
     players = (
         Player(identifier=0, position=(0, 0), controller=ControllerType.AI, score=5),
         Player(identifier=1, position=(0, 0), controller=ControllerType.AI, score=1),
         Player(identifier=2, position=(0, 0), controller=ControllerType.AI, score=1),
     )
-    jitter_values = iter([0.2, 0.8, 0.1])
-    monkeypatch.setattr(game_module.random, "random", lambda: next(jitter_values))
-    monkeypatch.setattr(game_module.random, "choice", lambda seq: seq[-1])
-
-    game = Game.__new__(Game)
-    game._state = SimpleNamespace(players=players)
+    game = bare_game
+    game._rng = _ScriptedRng(np.array([0.2, 0.8, 0.1]))
+    game._state = _FakeState(players=players)
     game._ai_controllers = {
         0: _StubController(),
         1: _StubController(),
         2: _StubController(),
     }
-    game._human_player_identifier = None
     game._next_randomization_time = 0.0
     game._rolling_score = _StubRollingScore({0: 4, 1: 1, 2: 0})
 
@@ -147,15 +191,14 @@ def test_game_randomize_lowest_agent_respects_interval(monkeypatch: pytest.Monke
     assert game._next_randomization_time == pytest.approx(Game._RANDOMIZATION_INTERVAL_SECONDS)
 
 
-def test_game_randomize_lowest_agent_waits_for_interval() -> None:
+def test_game_randomize_lowest_agent_waits_for_interval(bare_game: Game) -> None:
     players = (
         Player(identifier=0, position=(0, 0), controller=ControllerType.AI, score=0),
     )
-    game = Game.__new__(Game)
-    game._state = SimpleNamespace(players=players)
+    game = bare_game
+    game._state = _FakeState(players=players)
     controller = _StubController()
     game._ai_controllers = {0: controller}
-    game._human_player_identifier = None
     game._next_randomization_time = 100.0
     game._rolling_score = _StubRollingScore({0: 2})
 
@@ -164,24 +207,21 @@ def test_game_randomize_lowest_agent_waits_for_interval() -> None:
     assert controller.randomized is False
 
 
-def test_game_randomize_lowest_agent_single_candidate(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_game_randomize_lowest_agent_single_candidate(bare_game: Game) -> None:
     players = (
         Player(identifier=0, position=(0, 0), controller=ControllerType.AI, score=2),
     )
-    game = Game.__new__(Game)
-    game._state = SimpleNamespace(players=players)
+    game = bare_game
+    game._state = _FakeState(players=players)
     controller = _StubController()
     game._ai_controllers = {0: controller}
-    game._human_player_identifier = None
     game._next_randomization_time = 0.0
     game._rolling_score = _StubRollingScore({0: 0})
 
-    monkeypatch.setattr(game_module.random, "random", lambda: 0.5)
-
     def choice_fail(seq):  # pragma: no cover - sanity guard
         raise AssertionError("random.choice should not be invoked when only one candidate exists")
 
-    monkeypatch.setattr(game_module.random, "choice", choice_fail)
+    game._rng = SimpleNamespace(random=lambda: 0.5, choice=choice_fail)
 
     game._maybe_randomize_lowest_agent(0.0)
 
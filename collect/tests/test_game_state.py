@@ -2,56 +2,97 @@
 
 from __future__ import annotations
 
+import itertools
 import math
-from typing import Iterator, Tuple
+from contextvars import ContextVar
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import pytest
 
+import collect.config as config_module
+import collect.game_state as game_state_module
 from collect.config import FIELD_DIMENSIONS, MONSTER_REWARD_MAX, MONSTER_REWARD_SCALE, SHAPING_REWARD_MAX, SHAPING_REWARD_MIN
 from collect.game_state import GameObjects, GameState
 from collect.types import Action, ControllerType, Player
 
 
+_CELL_SOURCE: ContextVar[Optional[Iterator[Tuple[int, int]]]] = ContextVar("_CELL_SOURCE", default=None)
+_REAL_RANDOM_CELL = game_state_module._random_cell
+_TARGET_ZONE_FORBIDDEN = frozenset({(100, 100), (100, 99), (100, 101), (99, 100), (101, 100)})
+
+
 def deterministic_cells(*cells: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
-    for cell in cells:
-        yield cell
-    while True:
-        yield cells[-1]
+    return itertools.chain(cells, itertools.repeat(cells[-1]))
+
+
+def _make_pool_next_cell(
+    pool: Sequence[Tuple[int, int]],
+    observed_exclusions: Optional[List[FrozenSet[Tuple[int, int]]]] = None,
+) -> Callable[[Iterable[Tuple[int, int]]], Tuple[int, int]]:
+    candidates = itertools.cycle(pool)
+    pool_length = len(pool)
+
+    def next_cell(exclusions: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+        excluded = frozenset(exclusions)
+        if observed_exclusions is not None:
+            observed_exclusions.append(excluded)
+        for candidate in itertools.islice(candidates, pool_length):
+            if candidate not in excluded:
+                return candidate
+        raise AssertionError("Exhausted deterministic candidates while searching for free cell")
+
+    return next_cell
+
+
+def _scripted_random_cell(exclusions: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+    cells = _CELL_SOURCE.get()
+    if cells is None:
+        return _REAL_RANDOM_CELL(exclusions)
+    excluded = frozenset(exclusions)
+    for candidate in cells:
+        if candidate not in excluded:
+            return candidate
+    raise AssertionError("Exhausted deterministic candidates while searching for free cell")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def scripted_random_cell() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(game_state_module, "_random_cell", _scripted_random_cell)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reset_cell_source() -> Iterator[None]:
+    token = _CELL_SOURCE.set(None)
+    yield
+    _CELL_SOURCE.reset(token)
 
 
 @pytest.fixture(autouse=True)
 def disable_monster_movement(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.game_state.random.random", lambda: 1.0)
+    monkeypatch.setattr(game_state_module.random, "random", lambda: 1.0)
 
 
-def test_player_collects_resource(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 1, raising=False)
+def test_player_collects_resource(monkeypatch: pytest.MonkeyPatch, base_player: Player) -> None:
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 1, raising=False)
     cells = deterministic_cells(
         (40, 40),  # player start
         (60, 60),  # monster position
         (41, 40),  # resource position
     )
+    _CELL_SOURCE.set(cells)
+    state = GameState([base_player])
 
-    def next_cell(exclusions: tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
-        while True:
-            candidate = next(cells)
-            if candidate in exclusions:
-                continue
-            return candidate
-
-    monkeypatch.setattr("collect.game_state._random_cell", next_cell)
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
-
-    resource = state.resources[0]
-    action = Action.from_delta(resource[0] - state.players[0].position[0], resource[1] - state.players[0].position[1])
-    state.update_player(0, action)
+    assert state.players[0].position == (40, 40)
+    assert state.resources == ((41, 40),)
+    state.update_player(0, Action.MOVE_RIGHT)
     assert state.players[0].has_resource is True
     assert len(state.resources) == 0
 
 
-def test_player_delivers_resource(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 1, raising=False)
+def test_player_delivers_resource(monkeypatch: pytest.MonkeyPatch, base_player: Player) -> None:
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 1, raising=False)
     cells = deterministic_cells(
         (101, 100),  # player start near target
         (150, 150),  # monster position
@@ -62,17 +103,8 @@ def test_player_delivers_resource(monkeypatch: pytest.MonkeyPatch) -> None:
         (110, 110),  # resource after pickup
         (120, 120),  # resource after delivery
     )
-
-    def next_cell(exclusions: tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
-        while True:
-            candidate = next(cells)
-            if candidate in exclusions:
-                continue
-            return candidate
-
-    monkeypatch.setattr("collect.game_state._random_cell", next_cell)
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
+    _CELL_SOURCE.set(cells)
+    state = GameState([base_player])
 
     state.update_player(0, Action.MOVE_RIGHT)
     assert state.players[0].position == (102, 100)
@@ -91,19 +123,19 @@ def test_player_delivers_resource(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_player_delivers_resource_when_on_target(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        "collect.game_state.GameState._random_resource_position",
+        GameState,
+        "_random_resource_position",
         lambda self, *_: (15, 15),
         raising=False,
     )
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
-
     carrier = Player(identifier=0, position=(99, 100), controller=ControllerType.AI, has_resource=True, score=0)
-    state._objects = GameObjects(
-        players=(carrier,),
-        resources=(),
-        target=(100, 100),
-        monster=(140, 140),
+    state = GameState.from_objects(
+        GameObjects(
+            players=(carrier,),
+            resources=(),
+            target=(100, 100),
+            monster=(140, 140),
+        )
     )
     reward = state.update_player(0, Action.MOVE_RIGHT)
 
@@ -119,15 +151,17 @@ def test_player_adjacent_to_target_does_not_deliver(monkeypatch: pytest.MonkeyPa
         pytest.fail("Resource respawn should not be triggered when not delivering")
 
     carrier = Player(identifier=0, position=(101, 100), controller=ControllerType.AI, has_resource=True)
-    state = GameState([carrier])
-    state._objects = GameObjects(
-        players=(carrier,),
-        resources=(),
-        target=(100, 100),
-        monster=(150, 150),
+    state = GameState.from_objects(
+        GameObjects(
+            players=(carrier,),
+            resources=(),
+            target=(100, 100),
+            monster=(150, 150),
+        )
     )
     monkeypatch.setattr(
-        "collect.game_state.GameState._random_resource_position",
+        GameState,
+        "_random_resource_position",
         fail_if_called,
         raising=False,
     )
@@ -139,8 +173,10 @@ def test_player_adjacent_to_target_does_not_deliver(monkeypatch: pytest.MonkeyPa
     assert state.players[0].score == 0
 
 
-def test_collision_drops_resource(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 1, raising=False)
+def test_collision_drops_resource(
+    monkeypatch: pytest.MonkeyPatch, base_player: Player, second_player: Player
+) -> None:
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 1, raising=False)
     cells = deterministic_cells(
         (1, 1),  # player 0 start
         (1, 2),  # player 1 start
@@ -149,18 +185,8 @@ def test_collision_drops_resource(monkeypatch: pytest.MonkeyPatch) -> None:
         (10, 10),  # resource after pickup
         (7, 7),  # resource after collision drop
     )
-
-    def next_cell(exclusions: tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
-        while True:
-            candidate = next(cells)
-            if candidate in exclusions:
-                continue
-            return candidate
-
-    monkeypatch.setattr("collect.game_state._random_cell", next_cell)
-    player0 = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    player1 = Player(identifier=1, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player0, player1])
+    _CELL_SOURCE.set(cells)
+    state = GameState([base_player, second_player])
 
     state.update_player(0, Action.MOVE_RIGHT)
     assert state.players[0].has_resource is True
@@ -174,25 +200,17 @@ def test_collision_drops_resource(monkeypatch: pytest.MonkeyPatch) -> None:
     assert len(state.resources) == 1
 
 
-def test_collision_penalty_zero(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 0, raising=False)
+def test_collision_penalty_zero(
+    monkeypatch: pytest.MonkeyPatch, base_player: Player, second_player: Player
+) -> None:
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 0, raising=False)
     cells = deterministic_cells(
         (5, 5),  # player 0 start
         (5, 6),  # player 1 start
         (8, 8),  # monster position
     )
-
-    def next_cell(exclusions: tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
-        while True:
-            candidate = next(cells)
-            if candidate in exclusions:
-                continue
-            return candidate
-
-    monkeypatch.setattr("collect.game_state._random_cell", next_cell)
-    player0 = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    player1 = Player(identifier=1, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player0, player1])
+    _CELL_SOURCE.set(cells)
+    state = GameState([base_player, second_player])
 
     reward = state.update_player(0, Action.MOVE_DOWN)
 
@@ -201,10 +219,9 @@ def test_collision_penalty_zero(monkeypatch: pytest.MonkeyPatch) -> None:
     assert state.players[0].has_resource is False
 
 
-def test_distance_to_goal_with_resource_targets_center(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.game_state._random_cell", lambda exclusions: (50, 50))
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
+def test_distance_to_goal_with_resource_targets_center(monkeypatch: pytest.MonkeyPatch, base_player: Player) -> None:
+    monkeypatch.setattr(game_state_module, "_random_cell", lambda exclusions: (50, 50))
+    state = GameState([base_player])
 
     carrying_player = Player(identifier=0, position=(60, 90), controller=ControllerType.AI, has_resource=True)
     distance = state._distance_to_goal(carrying_player, tuple(), state.target)
@@ -216,8 +233,8 @@ def test_distance_to_goal_with_resource_targets_center(monkeypatch: pytest.Monke
     assert distance == pytest.approx(expected)
 
 
-def test_resources_never_spawn_in_target_zone(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 2, raising=False)
+def test_resources_never_spawn_in_target_zone(monkeypatch: pytest.MonkeyPatch, base_player: Player) -> None:
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 2, raising=False)
     candidate_pool = [
         (100, 100),  # target, should be skipped
         (100, 99),  # adjacent, should be skipped
@@ -229,37 +246,14 @@ def test_resources_never_spawn_in_target_zone(monkeypatch: pytest.MonkeyPatch) -
         (14, 14),
         (16, 16),
     ]
-    index = 0
-
-    def next_cell(exclusions: tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
-        nonlocal index
-        checked = 0
-        pool_length = len(candidate_pool)
-        while checked < pool_length:
-            candidate = candidate_pool[index % pool_length]
-            index += 1
-            checked += 1
-            if candidate in exclusions:
-                continue
-            return candidate
-        raise AssertionError("Exhausted deterministic candidates while searching for free cell")
-
-    monkeypatch.setattr("collect.game_state._random_cell", next_cell)
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
+    monkeypatch.setattr(game_state_module, "_random_cell", _make_pool_next_cell(candidate_pool))
+    state = GameState([base_player])
 
-    forbidden = {
-        (100, 100),
-        (100, 99),
-        (100, 101),
-        (99, 100),
-        (101, 100),
-    }
-    assert all(resource not in forbidden for resource in state.resources)
+    assert _TARGET_ZONE_FORBIDDEN.isdisjoint(state.resources)
 
 
-def test_resources_do_not_overlap(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 2, raising=False)
+def test_resources_do_not_overlap(monkeypatch: pytest.MonkeyPatch, base_player: Player) -> None:
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 2, raising=False)
     placement_sequence = [
         (30, 30),  # player position
         (40, 40),  # monster position
@@ -268,25 +262,13 @@ def test_resources_do_not_overlap(monkeypatch: pytest.MonkeyPatch) -> None:
         (70, 70),  # second resource
         (80, 80),  # respawn after collection
     ]
-    index = 0
-    observed_exclusions: list[set[Tuple[int, int]]] = []
-
-    def next_cell(exclusions: tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
-        nonlocal index
-        observed_exclusions.append(set(exclusions))
-        tested = 0
-        while tested < len(placement_sequence):
-            candidate = placement_sequence[index % len(placement_sequence)]
-            index += 1
-            tested += 1
-            if candidate in exclusions:
-                continue
-            return candidate
-        raise AssertionError("Exhausted deterministic candidates while searching for free cell")
-
-    monkeypatch.setattr("collect.game_state._random_cell", next_cell)
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
+    observed_exclusions: list[frozenset[Tuple[int, int]]] = []
+    monkeypatch.setattr(
+        game_state_module,
+        "_random_cell",
+        _make_pool_next_cell(placement_sequence, observed_exclusions),
+    )
+    state = GameState([base_player])
 
     assert len(state.resources) == 2
     assert len(set(state.resources)) == len(state.resources)
@@ -296,25 +278,18 @@ def test_resources_do_not_overlap(monkeypatch: pytest.MonkeyPatch) -> None:
     assert any(state.resources[0] in exclusions for exclusions in observed_exclusions)
 
 
-def test_player_carrying_cannot_collect_second_resource(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 2, raising=False)
+def test_player_carrying_cannot_collect_second_resource(
+    monkeypatch: pytest.MonkeyPatch, base_player: Player
+) -> None:
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 2, raising=False)
     cells = deterministic_cells(
         (10, 10),  # player position
         (20, 20),  # monster position
         (11, 10),  # first resource
         (12, 10),  # second resource
     )
-
-    def next_cell(exclusions: tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
-        while True:
-            candidate = next(cells)
-            if candidate in exclusions:
-                continue
-            return candidate
-
-    monkeypatch.setattr("collect.game_state._random_cell", next_cell)
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
+    _CELL_SOURCE.set(cells)
+    state = GameState([base_player])
 
     assert state.players[0].position == (10, 10)
     assert set(state.resources) == {(11, 10), (12, 10)}
@@ -331,15 +306,16 @@ def test_player_carrying_cannot_collect_second_resource(monkeypatch: pytest.Monk
 
 
 def test_monster_moves_toward_nearest_carrier(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.game_state.random.random", lambda: 0.0)
+    monkeypatch.setattr(game_state_module.random, "random", lambda: 0.0)
     carrier = Player(identifier=0, position=(5, 5), controller=ControllerType.AI).with_resource(True)
     other = Player(identifier=1, position=(10, 10), controller=ControllerType.AI)
-    state = GameState([carrier, other])
-    state._objects = GameObjects(
-        players=(carrier, other),
-        resources=(),
-        target=(20, 20),
-        monster=(0, 0),
+    state = GameState.from_objects(
+        GameObjects(
+            players=(carrier, other),
+            resources=(),
+            target=(20, 20),
+            monster=(0, 0),
+        )
     )
 
     state.update_player(0, Action.STAY)
@@ -349,20 +325,22 @@ def test_monster_moves_toward_nearest_carrier(monkeypatch: pytest.MonkeyPatch) -
 
 
 def test_monster_steals_resource_when_colliding(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("collect.config.RESOURCE_COUNT", 0, raising=False)
-    monkeypatch.setattr("collect.game_state.random.random", lambda: 0.0)
+    monkeypatch.setattr(config_module, "RESOURCE_COUNT", 0, raising=False)
+    monkeypatch.setattr(game_state_module.random, "random", lambda: 0.0)
     monkeypatch.setattr(
-        "collect.game_state.GameState._random_resource_position",
+        GameState,
+        "_random_resource_position",
         lambda self, *_: (6, 6),
         raising=False,
     )
     carrier = Player(identifier=0, position=(4, 4), controller=ControllerType.AI).with_resource(True)
-    state = GameState([carrier])
-    state._objects = GameObjects(
-        players=(carrier,),
-        resources=(),
-        target=(20, 20),
-        monster=(3, 3),
+    state = GameState.from_objects(
+        GameObjects(
+            players=(carrier,),
+            resources=(),
+            target=(20, 20),
+            monster=(3, 3),
+        )
     )
 
     state.update_player(0, Action.STAY)
@@ -377,22 +355,23 @@ def test_monster_steals_resource_when_colliding(monkeypatch: pytest.MonkeyPatch)
 def test_monster_moves_only_when_random_below_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
     def build_state() -> GameState:
         carrier = Player(identifier=0, position=(4, 4), controller=ControllerType.AI).with_resource(True)
-        state = GameState([carrier])
-        state._objects = GameObjects(
-            players=(carrier,),
-            resources=(),
-            target=(10, 10),
-            monster=(0, 0),
+        state = GameState.from_objects(
+            GameObjects(
+                players=(carrier,),
+                resources=(),
+                target=(10, 10),
+                monster=(0, 0),
+            )
         )
         return state
 
-    monkeypatch.setattr("collect.game_state.random.random", lambda: 0.29)
+    monkeypatch.setattr(game_state_module.random, "random", lambda: 0.29)
     moving_state = build_state()
     moving_state.update_player(0, Action.STAY)
     moving_state.advance_environment()
     assert moving_state.monster == (1, 1)
 
-    monkeypatch.setattr("collect.game_state.random.random", lambda: 0.3)
+    monkeypatch.setattr(game_state_module.random, "random", lambda: 0.3)
     stationary_state = build_state()
     stationary_state.update_player(0, Action.STAY)
     stationary_state.advance_environment()
@@ -401,13 +380,13 @@ def test_monster_moves_only_when_random_below_threshold(monkeypatch: pytest.Monk
 
 def test_monster_reward_positive_when_distance_increases() -> None:
     player = Player(identifier=0, position=(5, 5), controller=ControllerType.AI)
-    state = GameState([player])
-    configured_player = player.with_position((5, 5))
-    state._objects = GameObjects(
-        players=(configured_player,),
-        resources=(),
-        target=(10, 10),
-        monster=(5, 5),
+    state = GameState.from_objects(
+        GameObjects(
+            players=(player,),
+            resources=(),
+            target=(10, 10),
+            monster=(5, 5),
+        )
     )
 
     reward = state.update_player(0, Action.MOVE_RIGHT)
@@ -417,13 +396,13 @@ def test_monster_reward_positive_when_distance_increases() -> None:
 
 def test_monster_reward_negative_when_distance_decreases() -> None:
     player = Player(identifier=0, position=(5, 5), controller=ControllerType.AI)
-    state = GameState([player])
-    configured_player = player.with_position((5, 5))
-    state._objects = GameObjects(
-        players=(configured_player,),
-        resources=(),
-        target=(10, 10),
-        monster=(7, 5),
+    state = GameState.from_objects(
+        GameObjects(
+            players=(player,),
+            resources=(),
+            target=(10, 10),
+            monster=(7, 5),
+        )
     )
 
     reward = state.update_player(0, Action.MOVE_RIGHT)
@@ -431,73 +410,65 @@ def test_monster_reward_negative_when_distance_decreases() -> None:
     assert reward == pytest.approx(MONSTER_REWARD_SCALE)
 
 
-def _expected_magnitude(distance: float) -> float:
-    max_distance = math.hypot(FIELD_DIMENSIONS.width - 1, FIELD_DIMENSIONS.height - 1)
-    if max_distance == 0:
-        return SHAPING_REWARD_MIN
-    clamped = max(0.0, min(distance, max_distance))
-    scale = clamped / max_distance
-    return SHAPING_REWARD_MIN + (SHAPING_REWARD_MAX - SHAPING_REWARD_MIN) * scale
-
-
-def test_shaping_reward_scales_positive_with_distance() -> None:
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI).with_resource(True)
-    state = GameState([player])
-    configured_player = player.with_position((10, 10))
-    state._objects = GameObjects(
-        players=(configured_player,),
-        resources=(),
-        target=(13, 10),
-        monster=(0, 0),
-    )
-
-    after_distance = state._distance_to_goal(configured_player, state.resources, state.target)
-    assert after_distance is not None
-
-    reward = state._shaping_reward(player_index=0, before_distance=after_distance + 1.0)
+_MAX_DISTANCE = math.hypot(FIELD_DIMENSIONS.width - 1, FIELD_DIMENSIONS.height - 1)
+_SHAPING_SPAN = SHAPING_REWARD_MAX - SHAPING_REWARD_MIN
 
-    assert reward == pytest.approx(_expected_magnitude(after_distance))
 
-
-def test_shaping_reward_scales_negative_with_distance() -> None:
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI).with_resource(True)
-    state = GameState([player])
-    configured_player = player.with_position((20, 20))
-    state._objects = GameObjects(
-        players=(configured_player,),
-        resources=(),
-        target=(10, 20),
-        monster=(0, 0),
+def _expected_magnitude(distance: float) -> float:
+    if _MAX_DISTANCE == 0:
+        return SHAPING_REWARD_MIN
+    clamped = max(0.0, min(distance, _MAX_DISTANCE))
+    return SHAPING_REWARD_MIN + _SHAPING_SPAN * (clamped / _MAX_DISTANCE)
+
+
+@pytest.mark.parametrize(
+    ("player_position", "target", "before_offset", "expected_sign"),
+    [
+        ((10, 10), (13, 10), 1.0, 1.0),
+        ((20, 20), (10, 20), -1.0, -1.0),
+        ((50, 50), (50, 50), 1.0, 1.0),
+    ],
+    ids=["closer-positive", "farther-negative", "on-target-minimum"],
+)
+def test_shaping_reward_scales_with_distance(
+    player_position: Tuple[int, int],
+    target: Tuple[int, int],
+    before_offset: float,
+    expected_sign: float,
+) -> None:
+    player = Player(identifier=0, position=player_position, controller=ControllerType.AI, has_resource=True)
+    state = GameState.from_objects(
+        GameObjects(
+            players=(player,),
+            resources=(),
+            target=target,
+            monster=(0, 0),
+        )
     )
 
-    after_distance = state._distance_to_goal(configured_player, state.resources, state.target)
+    after_distance = state._distance_to_goal(player, state.resources, state.target)
     assert after_distance is not None
 
-    reward = state._shaping_reward(player_index=0, before_distance=max(0.0, after_distance - 1.0))
+    reward = state._shaping_reward(player_index=0, before_distance=max(0.0, after_distance + before_offset))
 
-    assert reward == pytest.approx(-_expected_magnitude(after_distance))
+    assert reward == pytest.approx(expected_sign * _expected_magnitude(after_distance))
 
 
-def test_shaping_reward_uses_minimum_when_distance_zero() -> None:
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI).with_resource(True)
-    state = GameState([player])
-    configured_player = player.with_position((50, 50))
-    state._objects = GameObjects(
-        players=(configured_player,),
-        resources=(),
-        target=(50, 50),
-        monster=(0, 0),
+def test_shaping_reward_returns_zero_when_before_distance_unknown(base_player: Player) -> None:
+    state = GameState.from_objects(
+        GameObjects(
+            players=(base_player,),
+            resources=(),
+            target=(10, 10),
+            monster=(0, 0),
+        )
     )
 
-    reward = state._shaping_reward(player_index=0, before_distance=1.0)
-
-    assert reward == pytest.approx(_expected_magnitude(0))
-
+    reward = state._shaping_reward(player_index=0, before_distance=None)
 
-def test_shaping_reward_returns_zero_when_before_distance_unknown() -> None:
-    player = Player(identifier=0, position=(0, 0), controller=ControllerType.AI)
-    state = GameState([player])
+    assert reward == 0.0
 
-    reward = state._shaping_reward(player_index=0, before_distance=None)
 
-    assert reward == 0.0
\ No newline at end of file
+def test_from_objects_requires_players() -> None:
+    with pytest.raises(ValueError):
+        GameState.from_objects(GameObjects(players=(), resources=(), target=(10, 10), monster=(0, 0)))
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+from typing import Sequence, Tuple
+
 import numpy as np
 import pytest
 
@@ -7,6 +10,17 @@ from collect.neural_agent import NeuralPolicyAgent
 from collect.types import Observation
 
 
+_STATE_SIZE = Observation.vector_length()
+
+
+def _load_parameters(
+    agent: NeuralPolicyAgent, weights: Sequence[np.ndarray], biases: Sequence[np.ndarray]
+) -> None:
+    """Copy layer values into the agent's parameter buffer through its views."""
+    for view, values in zip((*agent._weights, *agent._biases), (*weights, *biases)):
+        view[...] = values
+
+
 def test_neural_policy_agent_uses_configured_architecture() -> None:
     agent = NeuralPolicyAgent(state_size=9, action_size=9)
 
@@ -33,7 +47,7 @@ def test_neural_policy_agent_uses_configured_architecture() -> None:
 
 
 def test_neural_policy_agent_initializes_multi_layer():
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     agent = NeuralPolicyAgent(state_size=state_size, action_size=9)
 
     assert len(agent._weights) == agent.hidden_layers + 1
@@ -51,7 +65,7 @@ def test_neural_policy_agent_initializes_multi_layer():
 
 
 def test_neural_policy_agent_act_and_learn_updates_all_layers():
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     agent = NeuralPolicyAgent(state_size=state_size, action_size=9)
     agent._epsilon_values[0] = 0.0
     agent.epsilon_min = 0.0
@@ -77,7 +91,7 @@ def test_neural_policy_agent_act_and_learn_updates_all_layers():
 
 
 def test_neural_policy_agent_backprop_uses_pre_update_weights():
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     agent = NeuralPolicyAgent(
         state_size=state_size,
         action_size=3,
@@ -105,8 +119,7 @@ def test_neural_policy_agent_backprop_uses_pre_update_weights():
     )
     bias_output = np.array([0.0, 0.05, -0.15], dtype=np.float32)
 
-    agent._weights = (weight_hidden.copy(), weight_output.copy())
-    agent._biases = (bias_hidden.copy(), bias_output.copy())
+    _load_parameters(agent, (weight_hidden, weight_output), (bias_hidden, bias_output))
 
     hidden_pre = state @ weight_hidden + bias_hidden
     hidden = np.tanh(hidden_pre)
@@ -148,7 +161,7 @@ def test_neural_policy_agent_backprop_uses_pre_update_weights():
 
 
 def test_neural_policy_agent_epsilon_decay_progresses_monotonically():
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     agent = NeuralPolicyAgent(state_size=state_size, action_size=9)
     agent._epsilon_values[0] = 1.0
     agent.epsilon_min = 0.0
@@ -159,7 +172,7 @@ def test_neural_policy_agent_epsilon_decay_progresses_monotonically():
 
 
 def test_neural_policy_agent_tracks_epsilon_per_actor_independently():
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     agent = NeuralPolicyAgent(state_size=state_size, action_size=9, epsilon_start=0.5, epsilon_min=0.0)
     agent._epsilon_values[1] = 1.0
     agent._epsilon_values[2] = 0.25
@@ -173,9 +186,11 @@ def test_neural_policy_agent_tracks_epsilon_per_actor_independently():
 def test_randomize_weights_resets_all_parameters() -> None:
     agent = NeuralPolicyAgent(state_size=8, action_size=4, hidden_size=6, hidden_layers=2)
 
-    agent._weights = tuple(np.full_like(weight, 0.5, dtype=np.float32) for weight in agent._weights)
-    agent._biases = tuple(np.full_like(bias, -0.25, dtype=np.float32) for bias in agent._biases)
-    agent._epsilon_values = {0: 0.2, 1: 0.1}
+    for weight in agent._weights:
+        weight.fill(0.5)
+    for bias in agent._biases:
+        bias.fill(-0.25)
+    agent._epsilon_values[:2] = (0.2, 0.1)
 
     agent.randomize_weights()
 
@@ -185,32 +200,37 @@ def test_randomize_weights_resets_all_parameters() -> None:
     for bias in agent._biases:
         assert not np.allclose(bias, -0.25)
 
-    assert all(rate == agent.epsilon_start for rate in agent._epsilon_values.values())
-
+    assert np.all(agent._epsilon_values == np.float32(agent.epsilon_start))
 
-def test_randomize_percentile_weights_updates_small_parameters() -> None:
-    agent = NeuralPolicyAgent(state_size=6, action_size=3, hidden_size=4, hidden_layers=1)
 
-    weight_hidden = np.linspace(-0.1, 0.1, num=24, dtype=np.float32).reshape(agent.state_size, agent.hidden_size)
-    bias_hidden = np.linspace(-0.05, 0.05, num=agent.hidden_size, dtype=np.float32)
-    weight_output = np.linspace(-0.2, 0.2, num=12, dtype=np.float32).reshape(agent.hidden_size, agent.action_size)
-    bias_output = np.linspace(-0.1, 0.1, num=agent.action_size, dtype=np.float32)
+_LinspaceParams = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
 
-    agent._weights = (weight_hidden.copy(), weight_output.copy())
-    agent._biases = (bias_hidden.copy(), bias_output.copy())
-    agent._epsilon_values = {0: 0.15}
 
-    flat_abs = np.concatenate(
-        [
-            np.abs(weight_hidden).ravel(),
-            np.abs(bias_hidden),
-            np.abs(weight_output).ravel(),
-            np.abs(bias_output),
-        ]
+@pytest.fixture(scope="module")
+def linspace_params() -> _LinspaceParams:
+    """Read-only 6-4-3 layer parameters plus their sorted magnitudes; tests copy what they mutate."""
+    weight_hidden = np.linspace(-0.1, 0.1, num=24, dtype=np.float32).reshape(6, 4)
+    bias_hidden = np.linspace(-0.05, 0.05, num=4, dtype=np.float32)
+    weight_output = np.linspace(-0.2, 0.2, num=12, dtype=np.float32).reshape(4, 3)
+    bias_output = np.linspace(-0.1, 0.1, num=3, dtype=np.float32)
+    sorted_abs = np.sort(
+        np.abs(np.concatenate([weight_hidden.ravel(), bias_hidden, weight_output.ravel(), bias_output]))
     )
+    params = (weight_hidden, bias_hidden, weight_output, bias_output, sorted_abs)
+    for array in params:
+        array.setflags(write=False)
+    return params
+
+
+def test_randomize_percentile_weights_updates_small_parameters(linspace_params: _LinspaceParams) -> None:
+    agent = NeuralPolicyAgent(state_size=6, action_size=3, hidden_size=4, hidden_layers=1)
+    weight_hidden, bias_hidden, weight_output, bias_output, sorted_abs = linspace_params
+
+    _load_parameters(agent, (weight_hidden, weight_output), (bias_hidden, bias_output))
+    agent._epsilon_values[0] = 0.15
 
     percentile = 40.0
-    threshold = float(np.percentile(flat_abs, percentile))
+    threshold = float(sorted_abs[int(percentile / 100.0 * (sorted_abs.size - 1))])
 
     agent.randomize_percentile_weights(percentile)
 
@@ -236,4 +256,97 @@ def test_randomize_percentile_weights_updates_small_parameters() -> None:
     assert not np.allclose(updated_bias_output[output_bias_mask], bias_output[output_bias_mask])
     assert np.array_equal(updated_bias_output[~output_bias_mask], bias_output[~output_bias_mask])
 
-    assert all(rate == agent.epsilon_start for rate in agent._epsilon_values.values())
\ No newline at end of file
+    assert np.all(agent._epsilon_values == np.float32(agent.epsilon_start))
+
+
+def test_neural_policy_agent_act_uses_float32_master_weights() -> None:
+    agent = NeuralPolicyAgent(state_size=4, action_size=3, hidden_size=5, hidden_layers=2)
+    state = np.linspace(-1.0, 1.0, agent.state_size, dtype=np.float32)
+
+    agent.act(state)
+    _, probs, _ = agent._traces[0]
+
+    hidden = state
+    for weight, bias in zip(agent._weights[:-1], agent._biases[:-1]):
+        hidden = np.tanh(hidden @ weight + bias)
+    logits = hidden @ agent._weights[-1] + agent._biases[-1]
+    expected = np.exp(logits - logits.max())
+    np.testing.assert_allclose(probs, expected / expected.sum(), rtol=1e-5)
+
+
+def test_neural_policy_agent_grows_epsilon_values_for_new_actors() -> None:
+    agent = NeuralPolicyAgent(state_size=4, action_size=3, max_actors=2, epsilon_start=0.5)
+
+    assert agent.exploration_rate(5) == pytest.approx(0.5)
+    assert agent._epsilon_values.shape == (6,)
+    assert agent._epsilon_values.dtype == np.float32
+
+
+def test_neural_policy_agent_rejects_negative_actor_ids() -> None:
+    agent = NeuralPolicyAgent(state_size=4, action_size=3, max_actors=2)
+    agent._epsilon_values[-1] = 0.0
+
+    with pytest.raises(ValueError):
+        agent.exploration_rate(-1)
+    with pytest.raises(ValueError):
+        agent.act(np.zeros(agent.state_size, dtype=np.float32), actor_id=-1)
+
+    assert agent._epsilon_values[-1] == 0.0
+    assert -1 not in agent._traces
+    assert -1 not in agent._activation_arenas
+
+
+def test_neural_policy_agent_learns_in_place_within_parameter_buffer() -> None:
+    agent = NeuralPolicyAgent(state_size=4, action_size=3, hidden_size=5, hidden_layers=2)
+    agent._epsilon_values[0] = 0.0
+    agent.epsilon_min = 0.0
+
+    assert all(np.shares_memory(layer, agent._parameters) for layer in (*agent._weights, *agent._biases))
+    assert agent._parameters.size == sum(layer.size for layer in (*agent._weights, *agent._biases))
+
+    state = np.linspace(-1.0, 1.0, agent.state_size, dtype=np.float32)
+    agent.act(state)
+    output_before = agent._weights[-1].copy()
+
+    agent.learn(reward=1.0, next_state=state, done=False)
+
+    assert np.shares_memory(agent._weights[-1], agent._parameters)
+    assert not np.array_equal(agent._weights[-1], output_before)
+
+
+def test_neural_policy_agent_parameter_views_cannot_be_detached() -> None:
+    agent = NeuralPolicyAgent(state_size=4, action_size=3, hidden_size=5, hidden_layers=2)
+
+    with pytest.raises(AttributeError):
+        agent._weights = tuple(weight.copy() for weight in agent._weights)  # type: ignore[misc]
+
+    clone = copy.deepcopy(agent)
+    agent.randomize_weights()
+
+    assert all(np.shares_memory(layer, clone._parameters) for layer in (*clone._weights, *clone._biases))
+    assert not np.shares_memory(clone._parameters, agent._parameters)
+    assert all(np.shares_memory(layer, agent._parameters) for layer in (*agent._weights, *agent._biases))
+
+
+def test_neural_policy_agent_sample_skips_zero_probability_actions() -> None:
+    agent = NeuralPolicyAgent(state_size=4, action_size=4)
+    probs = np.array([0.0, 0.7, 0.0, 0.3], dtype=np.float32)
+
+    drawn = {agent._sample(probs) for _ in range(200)}
+
+    assert drawn == {1, 3}
+
+
+def test_neural_policy_agent_reuses_activation_arena_per_actor() -> None:
+    agent = NeuralPolicyAgent(state_size=4, action_size=3, hidden_size=5, hidden_layers=2)
+    state = np.linspace(-1.0, 1.0, agent.state_size, dtype=np.float32)
+
+    agent.act(state, actor_id=0)
+    first_activations = agent._traces[0][0]
+    agent.act(state, actor_id=1)
+    agent.act(state, actor_id=0)
+
+    arena = agent._activation_arenas[0]
+    assert all(np.shares_memory(hidden, arena) for hidden in first_activations[1:])
+    assert all(np.shares_memory(hidden, arena) for hidden in agent._traces[0][0][1:])
+    assert not np.shares_memory(agent._traces[1][0][1], arena)
@@ -6,6 +6,9 @@ from collect.config import FIELD_DIMENSIONS
 from collect.types import ControllerType, Observation, Player
 
 
+_STATE_SIZE = Observation.vector_length()
+
+
 def _make_player(identifier: int, position: tuple[int, int], *, has_resource: bool = False) -> Player:
     return Player(
         identifier=identifier,
@@ -35,7 +38,7 @@ def test_observation_vector_encodes_relative_offsets() -> None:
     width_span = FIELD_DIMENSIONS.width - 1
     height_span = FIELD_DIMENSIONS.height - 1
 
-    assert len(vector) == Observation.vector_length()
+    assert len(vector) == _STATE_SIZE
     assert vector[0] == pytest.approx((12 - 10) / width_span)
     assert vector[1] == pytest.approx((11 - 10) / height_span)
     assert vector[2] == pytest.approx((20 - 10) / width_span)
@@ -62,3 +65,56 @@ def test_observation_vector_defaults_when_data_missing() -> None:
     assert vector[:8] == (0.0,) * 8
     assert vector[8] == pytest.approx(1.0)
 
+
+def test_player_is_immutable_and_with_helpers_return_new_instances() -> None:
+    player = _make_player(0, (1, 1))
+
+    with pytest.raises(AttributeError):
+        player.score = 3  # type: ignore[misc]
+
+    moved = player.with_position((2, 1)).with_resource(True).with_score(4)
+
+    assert player.with_position((1, 1)) is player
+    assert moved == Player(
+        identifier=0,
+        position=(2, 1),
+        controller=ControllerType.AI,
+        has_resource=True,
+        score=4,
+    )
+    assert player.position == (1, 1)
+
+
+def test_observation_nearest_resource_prefers_first_of_equal_candidates() -> None:
+    player = _make_player(0, (100, 100))
+    resources = ((10, 10), (104, 97), (150, 20), (96, 104), (97, 104), (190, 190))
+
+    observation = Observation(
+        player=player,
+        players=(player,),
+        resources=resources,
+        target=(0, 0),
+        monster=(0, 0),
+    )
+
+    vector = observation.as_vector()
+
+    assert vector[0] == pytest.approx((104 - 100) / (FIELD_DIMENSIONS.width - 1))
+    assert vector[1] == pytest.approx((97 - 100) / (FIELD_DIMENSIONS.height - 1))
+
+
+def test_observation_vector_is_cached_float32_copy_of_tuple() -> None:
+    player = _make_player(0, (3, 4), has_resource=True)
+    observation = Observation(
+        player=player,
+        players=(player,),
+        resources=((5, 6),),
+        target=(1, 1),
+        monster=(9, 9),
+    )
+
+    array = observation.vector
+
+    assert array.dtype.name == "float32"
+    assert array.tolist() == pytest.approx(list(observation.as_vector()))
+    assert observation.vector is array
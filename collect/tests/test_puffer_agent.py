@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+from typing import Dict
+
 import numpy as np
 import pytest
-
-torch = pytest.importorskip("torch")
-
-from typing import Dict
+import torch
 
 from collect.puffer_agent import CollectPufferAgent
 from collect.types import Observation
 
 
+_STATE_SIZE = Observation.vector_length()
+
+
 def test_collect_puffer_agent_act_and_learn() -> None:
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     agent = CollectPufferAgent(state_size=state_size, action_size=9)
     state = np.zeros(state_size, dtype=np.float32)
     action = agent.act(state)
@@ -23,13 +25,13 @@ def test_collect_puffer_agent_act_and_learn() -> None:
 
 
 def test_collect_puffer_agent_validates_state_size() -> None:
-    agent = CollectPufferAgent(state_size=Observation.vector_length(), action_size=9)
+    agent = CollectPufferAgent(state_size=_STATE_SIZE, action_size=9)
     with pytest.raises(ValueError):
         agent.act(np.zeros((2, 7), dtype=np.float32))
 
 
 def test_collect_puffer_agent_uses_three_hidden_layers() -> None:
-    agent = CollectPufferAgent(state_size=Observation.vector_length(), action_size=9, hidden_size=64)
+    agent = CollectPufferAgent(state_size=_STATE_SIZE, action_size=9, hidden_size=64)
     policy = agent._policy
     linear_layers = [module for module in policy._encoder if isinstance(module, torch.nn.Linear)]
     assert len(linear_layers) == 3
@@ -38,7 +40,7 @@ def test_collect_puffer_agent_uses_three_hidden_layers() -> None:
 
 
 def test_collect_puffer_agent_bootstraps_value_with_next_state() -> None:
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     discount = 0.75
     agent = CollectPufferAgent(state_size=state_size, action_size=9, discount=discount)
     agent._max_grad_norm = 1e9  # ensure gradients are not clipped during the test
@@ -60,7 +62,7 @@ def test_collect_puffer_agent_bootstraps_value_with_next_state() -> None:
         state_tensor = torch.from_numpy(agent._to_state_array(state)).to(agent._device)
         next_state_tensor = torch.from_numpy(agent._to_state_array(next_state)).to(agent._device)
 
-        with torch.no_grad():
+        with torch.inference_mode():
             _, value = agent._policy.forward_eval(state_tensor.unsqueeze(0))
             _, next_value = agent._policy.forward_eval(next_state_tensor.unsqueeze(0))
 
@@ -83,7 +85,7 @@ def test_collect_puffer_agent_bootstraps_value_with_next_state() -> None:
 
 
 def test_collect_puffer_agent_terminal_transition_disables_bootstrap() -> None:
-    state_size = Observation.vector_length()
+    state_size = _STATE_SIZE
     agent = CollectPufferAgent(state_size=state_size, action_size=9, discount=0.9)
     agent._max_grad_norm = 1e9
 
@@ -103,7 +105,7 @@ def test_collect_puffer_agent_terminal_transition_disables_bootstrap() -> None:
     try:
         state_tensor = torch.from_numpy(agent._to_state_array(state)).to(agent._device)
 
-        with torch.no_grad():
+        with torch.inference_mode():
             _, value = agent._policy.forward_eval(state_tensor.unsqueeze(0))
 
         reward = 2.0
@@ -117,4 +119,21 @@ def test_collect_puffer_agent_terminal_transition_disables_bootstrap() -> None:
 
     value_scalar = value.squeeze(0)
     expected_grad = agent._value_coef * (value_scalar - torch.tensor(reward, device=value_scalar.device))
-    torch.testing.assert_close(grad, expected_grad, atol=1e-5, rtol=1e-5)
\ No newline at end of file
+    torch.testing.assert_close(grad, expected_grad, atol=1e-5, rtol=1e-5)
+
+
+def test_collect_puffer_agent_state_dict_keys_match_policy_layers() -> None:
+    agent = CollectPufferAgent(state_size=_STATE_SIZE, action_size=9, hidden_size=32)
+
+    assert list(agent._policy.state_dict()) == [
+        "_encoder.0.weight",
+        "_encoder.0.bias",
+        "_encoder.2.weight",
+        "_encoder.2.bias",
+        "_encoder.4.weight",
+        "_encoder.4.bias",
+        "_policy_head.weight",
+        "_policy_head.bias",
+        "_value_head.weight",
+        "_value_head.bias",
+    ]
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import pytest
+
+import collect.renderer as renderer_module
+from collect.config import CELL_SIZE_PX, FIELD_DIMENSIONS
 from collect.renderer import Renderer
 from collect.types import ControllerType, Player
 
@@ -20,3 +24,102 @@ def test_renderer_hud_text_formats_player_epsilon() -> None:
 
     assert text == "12s\n1: 3/20 25.5% rr:-2.00"
 
+
+def test_renderer_hud_text_without_overlays_lists_scores() -> None:
+    renderer = Renderer.__new__(Renderer)
+    players = (
+        Player(identifier=0, position=(0, 0), controller=ControllerType.AI, score=4),
+        Player(identifier=1, position=(0, 0), controller=ControllerType.AI, score=0),
+    )
+
+    text = renderer._hud_text(
+        players,
+        seconds_remaining=-1.0,
+        paused=True,
+        rolling_scores=None,
+        epsilon_percentages=None,
+    )
+
+    assert text == "0s\n0: 4\n1: 0"
+
+
+def test_renderer_sprite_blit_centers_sprite_on_cell() -> None:
+    class _StubSprite:
+        def get_width(self) -> int:
+            return CELL_SIZE_PX
+
+    renderer = Renderer.__new__(Renderer)
+    sprite = _StubSprite()
+    last_cell = (FIELD_DIMENSIONS.width - 1, FIELD_DIMENSIONS.height - 1)
+
+    assert renderer._sprite_blit(sprite, (0, 0)) == (sprite, (0, 0))
+    assert renderer._sprite_blit(sprite, (3, 7)) == (sprite, (3 * CELL_SIZE_PX, 7 * CELL_SIZE_PX))
+    assert renderer._sprite_blit(sprite, last_cell) == (
+        sprite,
+        (last_cell[0] * CELL_SIZE_PX, last_cell[1] * CELL_SIZE_PX),
+    )
+
+
+def test_renderer_render_text_reuses_cached_surfaces() -> None:
+    class _CountingFont:
+        def __init__(self) -> None:
+            self.rendered: list[str] = []
+
+        def render(self, line: str, antialias: bool, color: tuple[int, int, int]) -> "_StubSurface":
+            self.rendered.append(line)
+            return _StubSurface()
+
+    class _StubSurface:
+        def convert_alpha(self) -> "_StubSurface":
+            return self
+
+    renderer = Renderer.__new__(Renderer)
+    renderer._font = _CountingFont()
+    renderer._text_cache = {}
+    renderer._TEXT_CACHE_SIZE = 2
+
+    first = renderer._render_text("12s")
+    assert renderer._render_text("12s") is first
+    renderer._render_text("11s")
+    renderer._render_text("10s")
+
+    assert renderer._font.rendered == ["12s", "11s", "10s"]
+    assert list(renderer._text_cache) == ["11s", "10s"]
+
+
+def test_renderer_skips_redrawing_unchanged_frames_but_still_flips(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _StubSurface:
+        def __init__(self) -> None:
+            self.frames = 0
+
+        def get_width(self) -> int:
+            return 1
+
+        def blit(self, *_args: object) -> None:
+            pass
+
+        def blits(self, *_args: object, **_kwargs: object) -> None:
+            self.frames += 1
+
+    flips: list[None] = []
+    monkeypatch.setattr(renderer_module.pygame.display, "flip", lambda: flips.append(None))
+
+    renderer = Renderer.__new__(Renderer)
+    surface = _StubSurface()
+    renderer._surface = surface
+    renderer._grid_surface = surface
+    renderer._player_sprite = surface
+    renderer._carried_resource_sprite = surface
+    renderer._resource_sprite = surface
+    renderer._target_sprite = surface
+    renderer._monster_sprite = surface
+    renderer._last_frame_key = None
+    renderer._draw_hud = lambda hud_text: None
+
+    players = (Player(identifier=0, position=(1, 1), controller=ControllerType.AI),)
+    renderer.draw(players, ((2, 2),), (3, 3), (4, 4), 10.2, False)
+    renderer.draw(players, ((2, 2),), (3, 3), (4, 4), 10.7, False)
+    renderer.draw(players, ((2, 2),), (3, 3), (4, 4), 9.9, False)
+
+    assert surface.frames == 2
+    assert len(flips) == 3
@@ -37,3 +37,38 @@ def test_rolling_reward_handles_out_of_order_timestamps() -> None:
 
     assert tracker.total(3, current_time=53.1) == pytest.approx(3.5)
 
+
+def test_rolling_reward_merges_out_of_order_rewards_into_existing_second() -> None:
+    tracker = RollingReward(window_seconds=10.0)
+
+    tracker.record(player_identifier=4, timestamp=20.1, reward=1.0)
+    tracker.record(player_identifier=4, timestamp=21.3, reward=1.0)
+    tracker.record(player_identifier=4, timestamp=22.4, reward=1.0)
+    tracker.record(player_identifier=4, timestamp=20.7, reward=0.25)
+
+    assert tracker._seconds[4] == [20, 21, 22]
+    assert tracker._bucket_totals[4][0] == pytest.approx(1.25)
+    assert tracker.total(4, current_time=31.5) == pytest.approx(2.0)
+
+
+def test_rolling_reward_totals_includes_pending_and_committed_players() -> None:
+    tracker = RollingReward(window_seconds=10.0)
+
+    tracker.record(player_identifier=1, timestamp=5.2, reward=1.0)
+    tracker.record(player_identifier=1, timestamp=6.1, reward=0.5)
+    tracker.record(player_identifier=2, timestamp=6.4, reward=-2.0)
+    tracker.record(player_identifier=3, timestamp=6.5, reward=0.0)
+
+    assert tracker.totals(current_time=6.9) == {1: pytest.approx(1.0)}
+    assert tracker.totals(current_time=7.0) == {1: pytest.approx(1.5), 2: pytest.approx(-2.0)}
+    assert tracker.totals(current_time=16.5) == {1: pytest.approx(0.5), 2: pytest.approx(-2.0)}
+
+
+def test_rolling_reward_rejects_negative_identifiers() -> None:
+    tracker = RollingReward(window_seconds=10.0)
+
+    with pytest.raises(ValueError):
+        tracker.record(player_identifier=-1, timestamp=1.0, reward=1.0)
+
+    assert tracker.total(-1, current_time=2.0) == 0.0
+    assert tracker.total(7, current_time=2.0) == 0.0
@@ -25,3 +25,26 @@ def test_rolling_score_totals_filters_zero_entries() -> None:
     snapshot_after_window = tracker.totals(current_time=11.0)
     assert snapshot_after_window == {2: 1}
 
+
+def test_rolling_score_aggregates_events_by_second() -> None:
+    tracker = RollingScore(window_seconds=5.0)
+    tracker.record(player_identifier=1, timestamp=10.1)
+    tracker.record(player_identifier=1, timestamp=10.9, count=2)
+    tracker.record(player_identifier=1, timestamp=12.5)
+
+    assert len(tracker._seconds[1]) == 2
+    assert tracker.total(1, current_time=15.9) == 4
+    assert tracker.total(1, current_time=16.0) == 1
+    assert tracker.total(1, current_time=18.0) == 0
+
+
+def test_rolling_score_places_out_of_order_events_by_second() -> None:
+    tracker = RollingScore(window_seconds=10.0)
+    tracker.record(player_identifier=2, timestamp=20.1)
+    tracker.record(player_identifier=2, timestamp=22.4)
+    tracker.record(player_identifier=2, timestamp=21.3)
+    tracker.record(player_identifier=2, timestamp=20.7, count=2)
+
+    assert tracker._seconds[2] == [20, 21, 22]
+    assert tracker._bucket_counts[2] == [3, 1, 1]
+    assert tracker.total(2, current_time=31.0) == 2
@@ -1,7 +1,6 @@
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
 
@@ -12,13 +11,9 @@ PUBLIC_DIR = BASE_DIR / "resources" / "public"
 def create_app() -> FastAPI:
     app = FastAPI(title="MINIGAM")
     app.mount("/static", StaticFiles(directory=PUBLIC_DIR), name="static")
-
-    @app.get("/", response_class=HTMLResponse)
-    async def index() -> FileResponse:
-        return FileResponse(PUBLIC_DIR / "index.html")
-
+    # The root mount catches every path, so register routes above it; html=True serves index.html at "/".
+    app.mount("/", StaticFiles(directory=PUBLIC_DIR, html=True), name="public")
     return app
 
 
 app = create_app()
-
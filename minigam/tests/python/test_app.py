@@ -1,15 +1,20 @@
+from collections.abc import Iterator
+
+import pytest
 from fastapi.testclient import TestClient
 
-from app.main import create_app
+from app.main import app
+
 
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
 
-def test_index_serves_html():
-    app = create_app()
-    client = TestClient(app)
 
+def test_index_serves_html(client: TestClient):
     response = client.get("/")
 
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
     assert "<!DOCTYPE html>" in response.text
-